@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field, field_validator
-from typing import Union
+from typing import Optional, Union
 
 
 class Settings(BaseSettings):
@@ -26,6 +26,17 @@ class Settings(BaseSettings):
         default="gemini-2.5-flash-image", description="Gemini model to use"
     )
 
+    # Redis Configuration (optional shared cache for multi-worker deployments)
+    redis_url: Optional[str] = Field(
+        default=None, description="Redis URL for the shared response cache"
+    )
+
+    # TTS Configuration
+    tts_precision: str = Field(
+        default="fp16",
+        description="TTS model precision on GPU: fp16 uses *.fp16.onnx when present",
+    )
+
     # Application Configuration
     app_name: str = Field(default="Postul API", description="Application name")
     debug: bool = Field(default=False, description="Debug mode")
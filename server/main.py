@@ -1,6 +1,6 @@
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
 import logging
 import uvicorn
@@ -9,6 +9,9 @@ from config import settings
 from database import init_db, engine
 from routers import ideas, projects, tts, flyers
 from schema import HealthResponse
+from services.ai_service import ai_service
+from services.cache_service import cache_service
+from services.flyer_service import flyer_service
 
 # Configure logging
 logging.basicConfig(
@@ -29,6 +32,10 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         raise
+    # Warm the Gemini connection so the first flyer request skips the handshake
+    await flyer_service.warmup()
+    # Load the tokenizer off the event loop; it may download its BPE file
+    await ai_service.warmup()
     
     yield
     
@@ -37,6 +44,8 @@ async def lifespan(app: FastAPI):
     # Properly dispose of the database engine and close all connections
     await engine.dispose()
     logger.info("Database connections closed")
+    await cache_service.close()
+    await ai_service.close()
 
 
 # Create FastAPI application
@@ -46,6 +55,7 @@ app = FastAPI(
     version="0.1.0",
     debug=settings.debug,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson for faster response serialization
 )
 
 # Configure CORS
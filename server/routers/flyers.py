@@ -131,6 +131,7 @@ async def process_flyer_edit(
                 current_image_base64=flyer.image_url,
                 edit_instruction=edit_instruction,
                 conversation_history=conversation_history,
+                project_id=flyer.project_id,
             )
 
             # Update flyer with results
@@ -16,7 +16,7 @@ from schema import (
     GenerateSurveyPostsResponse,
     SurveyPostMessage,
 )
-from services.ai_service import ai_service
+from services.ai_service import ai_service, ChatMessage
 from dependencies import OptionalCurrentUser, get_user_id_or_anonymous
 
 logger = logging.getLogger(__name__)
@@ -308,12 +308,10 @@ async def tiki_taka_conversation(
         logger.info(f"Tiki-taka conversation for {user_type} user {user_id}")
         
         # Convert conversation history to the format expected by AI service
-        conversation_history = []
-        for msg in request.conversation_history:
-            conversation_history.append({
-                "role": msg.role,
-                "content": msg.content
-            })
+        conversation_history: list[ChatMessage] = [
+            {"role": msg.role, "content": msg.content}
+            for msg in request.conversation_history
+        ]
         
         # Generate advisor response
         advisor_message = await ai_service.tiki_taka_conversation(
@@ -3,7 +3,7 @@ TTS Router for text-to-speech synthesis using Supertonic.
 """
 
 from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 import logging
 
 from schema import TTSRequest, TTSResponse
@@ -39,7 +39,7 @@ async def synthesize_speech(request: TTSRequest):
                 )
 
         # Synthesize speech
-        audio_base64 = tts_service.synthesize_base64(
+        audio_base64 = await tts_service.synthesize_base64_async(
             text=request.text,
             inference_steps=request.inference_steps,
             style_id=request.style_id,
@@ -101,7 +101,7 @@ async def synthesize_speech_audio(
                 )
 
         # Synthesize speech
-        audio_bytes = tts_service.synthesize(
+        audio_bytes = await tts_service.synthesize_async(
             text=text,
             inference_steps=inference_steps,
             style_id=style_id,
@@ -136,6 +136,61 @@ async def synthesize_speech_audio(
         )
 
 
+@router.get("/stream/{text:path}", response_class=StreamingResponse)
+async def stream_speech_audio(
+    text: str, inference_steps: int = 2, style_id: int = 0, speed: float = 1.05
+):
+    """
+    Synthesize speech from text and stream WAV audio sentence by sentence.
+
+    Args:
+        text: Text to convert to speech (URL-encoded)
+        inference_steps: Number of inference steps (default: 2)
+        style_id: Voice style ID (default: 0)
+
+    Returns:
+        Streamed WAV audio; the first sentence plays before the rest is ready
+    """
+    try:
+        # Ensure TTS service is initialized
+        if not tts_service.is_initialized():
+            logger.info("Initializing TTS service...")
+            if not tts_service.initialize():
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="TTS service is not available. Please ensure models are downloaded.",
+                )
+
+        # The synchronous chunk iterator is consumed in Starlette's threadpool
+        chunks = tts_service.synthesize_stream(
+            text=text,
+            inference_steps=inference_steps,
+            style_id=style_id,
+            speed=speed,
+        )
+
+        return StreamingResponse(chunks, media_type="audio/wav")
+
+    except ValueError as e:
+        logger.error(f"Invalid request: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except RuntimeError as e:
+        logger.error(f"TTS synthesis failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"TTS synthesis failed: {str(e)}",
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error in TTS synthesis: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An unexpected error occurred during TTS synthesis.",
+        )
+
+
 @router.get("/health", status_code=status.HTTP_200_OK)
 async def tts_health():
     """
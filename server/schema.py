@@ -127,7 +127,7 @@ class TTSRequest(BaseModel):
     """Request model for text-to-speech synthesis."""
     text: str = Field(..., min_length=1, max_length=5000, description="Text to convert to speech")
     inference_steps: int = Field(default=2, ge=1, le=10, description="Number of inference steps (1-10)")
-    style_id: int = Field(default=0, ge=0, description="Voice style ID")
+    style_id: int = Field(default=0, ge=0, description="Voice style ID (index into the sorted voice style files; unknown IDs return 400)")
     speed: float = Field(default=1.15, ge=0.5, le=2.0, description="Speech speed multiplier")
 
 
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Script to convert Supertonic ONNX models to FP16.
+
+Writes a `<name>.fp16.onnx` sibling next to each converted model. The TTS
+service loads these automatically when running on a GPU execution provider
+with TTS_PRECISION=fp16. Inputs and outputs stay FP32, so no calling code
+changes are needed.
+
+Requires `onnx` and `onnxconverter-common`, which are not runtime
+dependencies:
+    uv pip install onnx onnxconverter-common
+"""
+
+import sys
+from pathlib import Path
+
+# The vocoder and vector estimator dominate synthesis time
+DEFAULT_MODELS = ["vector_estimator", "vocoder"]
+
+
+def convert_model(onnx_path: Path) -> Path:
+    """
+    Convert one ONNX model to FP16, keeping FP32 inputs and outputs.
+
+    Args:
+        onnx_path: Path to the FP32 model
+
+    Returns:
+        Path of the written FP16 model
+    """
+    import onnx
+    from onnxconverter_common import float16
+
+    model = onnx.load(str(onnx_path))
+    model_fp16 = float16.convert_float_to_float16(model, keep_io_types=True)
+    output_path = onnx_path.with_name(f"{onnx_path.stem}.fp16.onnx")
+    onnx.save(model_fp16, str(output_path))
+    return output_path
+
+
+def main():
+    """Main entry point."""
+    # Optional model names as arguments, e.g. `vocoder text_encoder`
+    names = [arg for arg in sys.argv[1:] if not arg.startswith("-")]
+    names = names or DEFAULT_MODELS
+
+    # Determine ONNX directory (default: server/assets/onnx)
+    script_dir = Path(__file__).parent.parent
+    onnx_dir = script_dir / "assets" / "onnx"
+
+    try:
+        import onnx  # noqa: F401
+        from onnxconverter_common import float16  # noqa: F401
+    except ImportError:
+        print(
+            "ERROR: onnx and onnxconverter-common are required: "
+            "uv pip install onnx onnxconverter-common",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    for name in names:
+        onnx_path = onnx_dir / f"{name}.onnx"
+        if not onnx_path.exists():
+            print(f"✗ Model not found: {onnx_path}", file=sys.stderr)
+            sys.exit(1)
+        output_path = convert_model(onnx_path)
+        print(f"✓ {name}: {output_path} ({output_path.stat().st_size:,} bytes)")
+
+    print("FP16 conversion completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,261 @@
 from openai import AsyncOpenAI
-from typing import Dict, Any, List, Optional
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional, TypedDict
+from pydantic import BaseModel, Field, ValidationError
 import logging
 import asyncio
+import hashlib
+import time
+from functools import partial
+from string import Template
+from urllib.parse import urlparse
+
+import httpx
+import tiktoken
 
 from config import settings
 from schema import ExtendedIdeaAnalysis, Source
-from services.og_service import OGImageService
-from google import genai
-from google.genai import types
+from services.og_service import OGImageService, OG_MAX_BYTES
+from services.cache_service import cache_service
 
 logger = logging.getLogger(__name__)
 
+# OG image cache settings (1 hour TTL)
+OG_CACHE_TTL = 3600
+OG_CACHE_MAX_ENTRIES = 1024
+# Overall time budget (seconds) for fetching OG images of an analysis
+OG_FETCH_BUDGET = 1.5
+
+# HTTP client timeouts (seconds); web-search analyses can run for minutes
+HTTP_TIMEOUT = 600.0
+HTTP_CONNECT_TIMEOUT = 5.0
+
+# Shared (Redis) analysis cache TTL (24 hours)
+ANALYSIS_CACHE_TTL = 86400
+
+# Input token budgets for prompts built from user-supplied text
+IDEA_CONTEXT_MAX_TOKENS = 1500
+CONVERSATION_HISTORY_MAX_TOKENS = 4000
+# Seconds between background retries when the tokenizer failed to load
+ENCODING_RETRY_INTERVAL = 60
+# Longest startup waits for the tokenizer; the load then finishes in the background
+TOKENIZER_WARMUP_TIMEOUT = 5
+
+
+def _request_key(*parts: Any) -> str:
+    """Hash request arguments into a compact key for deduplication and caching."""
+    raw = "\x1f".join("" if part is None else str(part) for part in parts)
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+class ChatMessage(TypedDict):
+    """Conversation message passed to tiki_taka_conversation."""
+
+    role: str
+    content: str
+
+
+# Structured-output models, defined once so the SDK builds their JSON schema once
+class ProjectDetails(BaseModel):
+    """Project details model for structured output."""
+
+    name: str = Field(
+        ...,
+        min_length=1,
+        max_length=255,
+        description="Concise project name (2-5 words)",
+    )
+    description: str = Field(
+        ...,
+        min_length=50,
+        description="Detailed project description (2-4 sentences)",
+    )
+
+
+class PollOption(BaseModel):
+    """Poll option model for structured output."""
+
+    text: str = Field(
+        ...,
+        min_length=1,
+        max_length=25,
+        description="Poll option text (keep it concise, max 25 characters)",
+    )
+
+
+class SurveyPost(BaseModel):
+    """Single survey post message model with poll options for structured output."""
+
+    text: str = Field(
+        ...,
+        min_length=10,
+        max_length=500,
+        description="Engaging survey post text/question that encourages interaction",
+    )
+    poll_options: List[PollOption] = Field(
+        ...,
+        min_length=2,
+        max_length=4,
+        description="Poll options (2-4 options, each max 25 characters)",
+    )
+
+
+class SurveyPostsResponse(BaseModel):
+    """Response model containing multiple survey posts."""
+
+    posts: List[SurveyPost] = Field(
+        ...,
+        min_length=1,
+        max_length=10,
+        description="List of survey post messages with poll options",
+    )
+
+
+# Prompt templates are parsed once at import instead of on every request
+_ANALYSIS_TMPL = Template("""Analyze the following startup idea and provide a comprehensive analysis:
+
+Idea: $idea
+
+Provide a detailed analysis including:
+1. Problem statement: A clear, research-backed problem statement that the idea addresses
+2. Summary: A brief summary of the idea and its core value proposition
+3. Strengths: Key strengths and potential advantages of this idea
+4. Weaknesses: Potential weaknesses, risks, or challenges
+5. Opportunities: Market opportunities and growth potential
+6. Threats: Competitive threats and market risks
+7. Actionable items: 3-5 specific, actionable steps to validate this idea
+8. Validation priority: High/Medium/Low based on idea clarity and market potential
+9. Saturation score: Rate market saturation from 0-10 (0 = untapped market, 10 = highly saturated)
+10. Juicy score: Rate idea potential/promise from 0-10 (0 = low potential, 10 = high potential)
+11. Sources: Include 2-4 relevant research sources (articles, studies, reports) with titles and URLs
+
+Focus on:
+- Problem clarity and validation needs
+- Market opportunity assessment
+- Practical next steps for validation
+- Critical assumptions that need testing
+- Realistic scoring based on market research
+
+Be constructive, specific, and actionable in your feedback.""")
+
+_X_INSTRUCTIONS = """
+- Optimize for X (Twitter) format: concise, punchy, engaging
+- Character limit: 280 characters
+- Use hashtags sparingly (1-2 max)
+- Include emojis to increase engagement
+- Make it shareable and retweetable
+- Focus on asking thought-provoking questions
+"""
+
+_THREADS_INSTRUCTIONS = """
+- Optimize for Threads format: conversational, engaging
+- Character limit: 500 characters
+- Can be slightly longer and more conversational than X
+- Use emojis naturally
+- Encourage discussion and replies
+- Focus on community engagement
+"""
+
+_GENERIC_INSTRUCTIONS = """
+- Create engaging survey posts suitable for social media
+- Keep posts concise and engaging
+- Include questions that encourage interaction
+- Use emojis appropriately
+- Make posts shareable and discussion-worthy
+"""
+
+# Platform -> (instructions, character limit); X/Twitter limit is the default
+_PLATFORM_PROMPTS = {
+    "x": (_X_INSTRUCTIONS, 280),
+    "threads": (_THREADS_INSTRUCTIONS, 500),
+}
+_GENERIC_PROMPT = (_GENERIC_INSTRUCTIONS, 280)
+
+_SURVEY_TMPL = Template("""Generate $count engaging survey post messages based on the following startup idea context.
+
+Idea Context:
+$idea_context
+
+$platform_instructions
+
+Requirements for each post:
+1. Should be engaging and encourage interaction (likes, replies, shares)
+2. Should relate to the idea and invite audience feedback
+3. Should be formatted as a question that works well with a poll
+4. Should be concise and within $char_limit characters
+5. Should use appropriate emojis (1-3 per post)
+6. Should be professional yet conversational
+7. Each post should have a slightly different angle or focus
+8. Should encourage people to vote in the poll
+
+CRITICAL: Each post MUST include exactly 2-4 poll options. The poll options should:
+- Be concise (max 25 characters each)
+- Be mutually exclusive choices that represent different perspectives, use cases, or opinions
+- Be creative, specific, and contextually relevant to the idea - avoid generic "Yes/No" options
+- Use emojis strategically (1 per option max) to make them more engaging
+- Cover different angles: user personas, use cases, pain points, preferences, or validation aspects
+- Be action-oriented or opinion-based when possible
+- Examples of good options:
+  * For education ideas: "Already using it", "Would try it", "Not for me", "Need more info"
+  * For product ideas: "I'd pay for this", "Free version only", "Not interested", "Tell me more"
+  * For service ideas: "Sign me up!", "Maybe later", "Not my thing", "Sounds interesting"
+- Make each option distinct and meaningful - they should help validate different aspects of the idea
+- Think about what would be most valuable to learn from the poll results
+
+Generate $count unique, engaging survey posts with creative, context-aware poll options that will help validate this startup idea through social media engagement.""")
+
 
 class AIService:
     """Service for OpenAI integration and AI-powered analysis generation."""
 
+    # Tokenizer shared by all instances, loaded at startup by warmup()
+    _encoding: ClassVar[Optional[tiktoken.Encoding]] = None
+    # Earliest time a failed tokenizer load may be retried, and the retry
+    _encoding_retry_at: ClassVar[float] = 0.0
+    _encoding_task: ClassVar[Optional[asyncio.Future]] = None
+
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        # One pooled HTTP/2 client per process, shared by OpenAI and OG fetches
+        self.http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+        )
+        self.client = AsyncOpenAI(
+            api_key=settings.openai_api_key, http_client=self.http_client
+        )
         self.model = settings.openai_model
-        self.gemini_client = genai.Client(api_key=settings.gemini_api_key)
-        self.gemini_model = settings.gemini_model
+        # Normalized source URL -> (fetched_at, image_url)
+        self._og_cache: Dict[str, tuple[float, Optional[str]]] = {}
+        # Per-URL locks so concurrent lookups of one URL share a single fetch
+        self._og_locks: Dict[str, asyncio.Lock] = {}
+        # OG fetches that outlived their request's budget, still filling the cache
+        self._og_background: set[asyncio.Task] = set()
+        # Request key -> in-flight task shared by identical concurrent calls
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def _coalesce(
+        self, key: str, factory: Callable[[], Awaitable[Any]]
+    ) -> Awaitable[Any]:
+        """
+        Run factory() once per key while a call is in flight.
+
+        Concurrent callers with the same key await the same task instead of
+        issuing duplicate upstream requests. The task is shielded so that a
+        cancelled caller does not cancel the work for the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return asyncio.shield(task)
+
+    async def close(self) -> None:
+        """Close the shared HTTP client and its connection pool."""
+        for task in self._og_background:
+            task.cancel()
+        await asyncio.gather(*self._og_background, return_exceptions=True)
+        await self.http_client.aclose()
 
     async def analyze_idea(self, transcribed_text: str) -> ExtendedIdeaAnalysis:
         """
@@ -31,6 +267,24 @@ class AIService:
         Returns:
             ExtendedIdeaAnalysis instance with scores and sources
         """
+        key = _request_key("analyze_idea", transcribed_text)
+        return await self._coalesce(key, partial(self._analyze_idea, transcribed_text))
+
+    async def _analyze_idea(self, transcribed_text: str) -> ExtendedIdeaAnalysis:
+        """Analyze an idea without request coalescing."""
+        cache_key = f"analysis:{_request_key(transcribed_text)}"
+        cached = await cache_service.get(cache_key)
+        if cached is not None:
+            try:
+                analysis = ExtendedIdeaAnalysis.model_validate_json(cached)
+            except ValidationError as e:
+                # Corrupt or written by an older schema; regenerate instead
+                logger.warning(f"Discarding invalid cached analysis {cache_key}: {e}")
+                await cache_service.delete(cache_key)
+            else:
+                logger.info("Serving idea analysis from shared cache")
+                return analysis
+
         prompt = self._build_analysis_prompt(transcribed_text)
 
         try:
@@ -69,6 +323,9 @@ class AIService:
             if analysis.sources:
                 analysis = await self._enrich_sources_with_images(analysis)
 
+            await cache_service.set(
+                cache_key, analysis.model_dump_json().encode(), ANALYSIS_CACHE_TTL
+            )
             return analysis
 
         except Exception as e:
@@ -82,6 +339,10 @@ class AIService:
         """
         Enrich sources with OG images fetched from their URLs.
 
+        Fetches still running after OG_FETCH_BUDGET are left to finish in the
+        background, so their results fill the cache for later analyses; their
+        sources are returned without an image this time.
+
         Args:
             analysis: The analysis with sources to enrich
 
@@ -91,21 +352,27 @@ class AIService:
         if not analysis.sources:
             return analysis
 
-        async with OGImageService() as og_service:
-            # Fetch images for all sources concurrently
+        async with OGImageService(self.http_client) as og_service:
+            # Fetch images for all sources concurrently, within a time budget
             tasks = [
-                self._fetch_source_image(og_service, source)
+                asyncio.create_task(self._fetch_source_image(og_service, source))
                 for source in analysis.sources
             ]
-            enriched_sources = await asyncio.gather(*tasks, return_exceptions=True)
+            done, pending = await asyncio.wait(tasks, timeout=OG_FETCH_BUDGET)
+            for task in pending:
+                self._og_background.add(task)
+                task.add_done_callback(self._og_background.discard)
+            if pending:
+                logger.info(
+                    f"OG image budget of {OG_FETCH_BUDGET}s exceeded for "
+                    f"{len(pending)}/{len(tasks)} sources"
+                )
 
             # Update sources with image URLs
             updated_sources = []
-            for i, source in enumerate(analysis.sources):
-                if i < len(enriched_sources) and not isinstance(
-                    enriched_sources[i], Exception
-                ):
-                    image_url = enriched_sources[i]
+            for source, task in zip(analysis.sources, tasks):
+                if task in done and task.exception() is None:
+                    image_url = task.result()
                     updated_sources.append(
                         Source(
                             title=source.title,
@@ -115,7 +382,7 @@ class AIService:
                         )
                     )
                 else:
-                    # Keep original source if image fetch failed
+                    # Keep original source if image fetch failed or timed out
                     updated_sources.append(source)
 
             # Create new analysis with updated sources
@@ -146,72 +413,87 @@ class AIService:
         Returns:
             Image URL if found, None otherwise
         """
+        key = self._og_cache_key(source.url)
+        cached = self._get_cached_og_image(key)
+        if cached is not None:
+            return cached[1]
+
+        lock = self._og_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            try:
+                return await self._fetch_source_image_locked(og_service, source, key)
+            finally:
+                # The result is stored by now, so later callers hit the cache;
+                # a newer lock for this URL belongs to someone else
+                if self._og_locks.get(key) is lock:
+                    del self._og_locks[key]
+
+    async def _fetch_source_image_locked(
+        self, og_service: OGImageService, source: Source, key: str
+    ) -> Optional[str]:
+        """Fetch and cache a source's OG image; the caller holds its URL lock."""
+        # Another request may have filled the cache while we were waiting
+        cached = self._get_cached_og_image(key)
+        if cached is not None:
+            return cached[1]
+
+        shared_key = f"og:{key}"
         try:
-            image_url = await og_service.fetch_og_image(source.url)
-            if image_url:
-                logger.info(f"Fetched OG image for source {source.title}: {image_url}")
+            # Peer workers may already have fetched this URL
+            shared = await cache_service.get(shared_key)
+            if shared is not None:
+                image_url = shared.decode() or None
             else:
-                logger.debug(f"No OG image found for source {source.title}")
-            return image_url
+                image_url = await og_service.fetch_og_image(
+                    source.url, max_bytes=OG_MAX_BYTES
+                )
+                if image_url:
+                    logger.info(
+                        f"Fetched OG image for source {source.title}: {image_url}"
+                    )
+                else:
+                    logger.debug(f"No OG image found for source {source.title}")
         except Exception as e:
             logger.warning(f"Error fetching OG image for source {source.title}: {e}")
             return None
 
-    def _build_analysis_prompt(self, transcribed_text: str) -> str:
-        """Build the prompt for AI analysis."""
-        return f"""Analyze the following startup idea and provide a comprehensive analysis:
-
-Idea: {transcribed_text}
-
-Provide a detailed analysis including:
-1. Problem statement: A clear, research-backed problem statement that the idea addresses
-2. Summary: A brief summary of the idea and its core value proposition
-3. Strengths: Key strengths and potential advantages of this idea
-4. Weaknesses: Potential weaknesses, risks, or challenges
-5. Opportunities: Market opportunities and growth potential
-6. Threats: Competitive threats and market risks
-7. Actionable items: 3-5 specific, actionable steps to validate this idea
-8. Validation priority: High/Medium/Low based on idea clarity and market potential
-9. Saturation score: Rate market saturation from 0-10 (0 = untapped market, 10 = highly saturated)
-10. Juicy score: Rate idea potential/promise from 0-10 (0 = low potential, 10 = high potential)
-11. Sources: Include 2-4 relevant research sources (articles, studies, reports) with titles and URLs
+        self._store_og_image(key, image_url)
+        if shared is None:
+            await cache_service.set(
+                shared_key, (image_url or "").encode(), OG_CACHE_TTL
+            )
+        return image_url
+
+    @staticmethod
+    def _og_cache_key(url: str) -> str:
+        """Normalize a source URL to origin + path for OG image caching."""
+        parsed = urlparse(url)
+        return parsed._replace(
+            scheme=parsed.scheme.lower(),
+            netloc=parsed.netloc.lower(),
+            query="",
+            fragment="",
+        ).geturl()
+
+    def _get_cached_og_image(self, key: str) -> Optional[tuple[float, Optional[str]]]:
+        """Return the cached (fetched_at, image_url) entry if it has not expired."""
+        entry = self._og_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= OG_CACHE_TTL:
+            del self._og_cache[key]
+            return None
+        return entry
 
-Focus on:
-- Problem clarity and validation needs
-- Market opportunity assessment
-- Practical next steps for validation
-- Critical assumptions that need testing
-- Realistic scoring based on market research
+    def _store_og_image(self, key: str, image_url: Optional[str]) -> None:
+        """Cache an OG image lookup, evicting the oldest entry when full."""
+        if key not in self._og_cache and len(self._og_cache) >= OG_CACHE_MAX_ENTRIES:
+            self._og_cache.pop(next(iter(self._og_cache)))
+        self._og_cache[key] = (time.monotonic(), image_url)
 
-Be constructive, specific, and actionable in your feedback."""
-
-    def _parse_text_response(self, content: str) -> Dict[str, Any]:
-        """Parse text response when JSON parsing fails."""
-        # Simple fallback parser - extract sections from text
-        analysis = {
-            "problem_statement": "",
-            "summary": content[:500] if len(content) > 500 else content,
-            "strengths": "",
-            "weaknesses": "",
-            "opportunities": "",
-            "threats": "",
-            "actionable_items": [],
-            "validation_priority": "Medium",
-        }
-        return analysis
-
-    def _normalize_analysis(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
-        """Ensure analysis has all required fields with defaults."""
-        return {
-            "problem_statement": analysis.get("problem_statement", ""),
-            "summary": analysis.get("summary", ""),
-            "strengths": analysis.get("strengths", ""),
-            "weaknesses": analysis.get("weaknesses", ""),
-            "opportunities": analysis.get("opportunities", ""),
-            "threats": analysis.get("threats", ""),
-            "actionable_items": analysis.get("actionable_items", []),
-            "validation_priority": analysis.get("validation_priority", "Medium"),
-        }
+    def _build_analysis_prompt(self, transcribed_text: str) -> str:
+        """Build the prompt for AI analysis."""
+        return _ANALYSIS_TMPL.substitute(idea=transcribed_text)
 
     def _get_fallback_analysis(self, transcribed_text: str) -> ExtendedIdeaAnalysis:
         """Return a fallback analysis when AI service fails."""
@@ -233,10 +515,114 @@ Be constructive, specific, and actionable in your feedback."""
             sources=[],
         )
 
+    def _load_encoding(self) -> Optional[tiktoken.Encoding]:
+        """
+        Load the tokenizer for the configured model.
+
+        Blocking: tiktoken downloads the BPE file on first use unless it is
+        already in TIKTOKEN_CACHE_DIR, so call this off the event loop.
+        A failure is logged and may be retried after ENCODING_RETRY_INTERVAL.
+        """
+        try:
+            try:
+                encoding = tiktoken.encoding_for_model(self.model)
+            except KeyError:
+                encoding = tiktoken.get_encoding("o200k_base")
+        except Exception as e:
+            logger.warning(f"Tokenizer unavailable, skipping input budgets: {e}")
+            AIService._encoding_retry_at = time.monotonic() + ENCODING_RETRY_INTERVAL
+            return None
+        AIService._encoding = encoding
+        return encoding
+
+    async def warmup(self) -> None:
+        """
+        Load the tokenizer at startup so requests never download it.
+
+        Waits at most TOKENIZER_WARMUP_TIMEOUT; a slower load (e.g. a stalled
+        BPE download) keeps running in the background and requests skip the
+        input budgets until it completes.
+        """
+        task = asyncio.ensure_future(asyncio.to_thread(self._load_encoding))
+        AIService._encoding_task = task
+        try:
+            await asyncio.wait_for(asyncio.shield(task), TOKENIZER_WARMUP_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Tokenizer not loaded after {TOKENIZER_WARMUP_TIMEOUT}s, "
+                "continuing startup"
+            )
+
+    def _get_encoding(self) -> Optional[tiktoken.Encoding]:
+        """
+        Return the shared tokenizer, or None while it is unavailable.
+
+        Never loads on the event loop; if the startup load failed, a retry is
+        scheduled in a worker thread at most once per ENCODING_RETRY_INTERVAL.
+        """
+        if AIService._encoding is None:
+            task = AIService._encoding_task
+            retry_due = time.monotonic() >= AIService._encoding_retry_at
+            if (task is None or task.done()) and retry_due:
+                AIService._encoding_retry_at = (
+                    time.monotonic() + ENCODING_RETRY_INTERVAL
+                )
+                AIService._encoding_task = asyncio.ensure_future(
+                    asyncio.to_thread(self._load_encoding)
+                )
+        return AIService._encoding
+
+    def _truncate(self, text: str, max_tokens: int) -> str:
+        """Keep the first max_tokens tokens of text."""
+        encoding = self._get_encoding()
+        if encoding is None:
+            return text
+        ids = encoding.encode(text)
+        if len(ids) <= max_tokens:
+            return text
+        return encoding.decode(ids[:max_tokens])
+
+    def _trim_history(
+        self, conversation_history: list[ChatMessage], max_tokens: int
+    ) -> list[ChatMessage]:
+        """
+        Drop the oldest messages until the history fits in max_tokens.
+
+        The newest message is always kept, truncated if it alone exceeds
+        the budget.
+        """
+        encoding = self._get_encoding()
+        if encoding is None:
+            return conversation_history
+        total = 0
+        start = len(conversation_history)
+        while start > 0:
+            content = conversation_history[start - 1]["content"]
+            total += len(encoding.encode(content))
+            if total > max_tokens:
+                break
+            start -= 1
+        if start == len(conversation_history) and conversation_history:
+            newest = conversation_history[-1]
+            start -= 1
+            logger.info(
+                f"Dropped {start} old messages and truncated the newest in "
+                "conversation history"
+            )
+            return [
+                {
+                    "role": newest["role"],
+                    "content": self._truncate(newest["content"], max_tokens),
+                }
+            ]
+        if start:
+            logger.info(f"Dropped {start} old messages from conversation history")
+        return conversation_history[start:]
+
     async def tiki_taka_conversation(
         self,
         transcribed_text: str,
-        conversation_history: list[Dict[str, str]] = None,
+        conversation_history: Optional[list[ChatMessage]] = None,
         idea_context: str = None,
     ) -> str:
         """
@@ -245,7 +631,8 @@ Be constructive, specific, and actionable in your feedback."""
 
         Args:
             transcribed_text: The user's current transcribed voice input
-            conversation_history: Previous conversation messages (list of dicts with 'role' and 'content')
+            conversation_history: Previous conversation messages, already normalized
+                to dicts with exactly 'role' and 'content' keys
             idea_context: Optional initial idea context if this is the start of a conversation
 
         Returns:
@@ -275,6 +662,7 @@ Your goal is to help users think critically about their idea, not to analyze it
         if idea_context and (
             not conversation_history or len(conversation_history) == 0
         ):
+            idea_context = self._truncate(idea_context, IDEA_CONTEXT_MAX_TOKENS)
             messages.append(
                 {"role": "user", "content": f"I have an idea: {idea_context}"}
             )
@@ -282,17 +670,12 @@ Your goal is to help users think critically about their idea, not to analyze it
             if conversation_history is None:
                 conversation_history = []
 
-        # Add conversation history
+        # Add conversation history, keeping the most recent messages in budget
         if conversation_history:
-            for msg in conversation_history:
-                # Ensure we have the right format
-                if isinstance(msg, dict):
-                    messages.append(
-                        {
-                            "role": msg.get("role", "user"),
-                            "content": msg.get("content", ""),
-                        }
-                    )
+            conversation_history = self._trim_history(
+                conversation_history, CONVERSATION_HISTORY_MAX_TOKENS
+            )
+            messages.extend(conversation_history)
 
         # Add current user message
         messages.append({"role": "user", "content": transcribed_text})
@@ -327,23 +710,13 @@ Your goal is to help users think critically about their idea, not to analyze it
         Returns:
             Dictionary with 'name' and 'description' keys
         """
-        from pydantic import BaseModel, Field
-
-        class ProjectDetails(BaseModel):
-            """Project details model for structured output."""
-
-            name: str = Field(
-                ...,
-                min_length=1,
-                max_length=255,
-                description="Concise project name (2-5 words)",
-            )
-            description: str = Field(
-                ...,
-                min_length=50,
-                description="Detailed project description (2-4 sentences)",
-            )
+        key = _request_key("generate_project_details", transcribed_text)
+        return await self._coalesce(
+            key, partial(self._generate_project_details, transcribed_text)
+        )
 
+    async def _generate_project_details(self, transcribed_text: str) -> Dict[str, str]:
+        """Generate project details without request coalescing."""
         prompt = f"""Based on the following startup idea, generate a concise project name and detailed description:
 
 Idea: {transcribed_text}
@@ -405,109 +778,25 @@ The description should be:
         Returns:
             List of dictionaries with 'id' and 'text' keys for each post message
         """
-        from pydantic import BaseModel, Field
-
-        class PollOption(BaseModel):
-            """Poll option model for structured output."""
-
-            text: str = Field(
-                ...,
-                min_length=1,
-                max_length=25,
-                description="Poll option text (keep it concise, max 25 characters)",
-            )
-
-        class SurveyPost(BaseModel):
-            """Single survey post message model with poll options for structured output."""
-
-            text: str = Field(
-                ...,
-                min_length=10,
-                max_length=500,
-                description="Engaging survey post text/question that encourages interaction",
-            )
-            poll_options: List[PollOption] = Field(
-                ...,
-                min_length=2,
-                max_length=4,
-                description="Poll options (2-4 options, each max 25 characters)",
-            )
-
-        class SurveyPostsResponse(BaseModel):
-            """Response model containing multiple survey posts."""
-
-            posts: List[SurveyPost] = Field(
-                ...,
-                min_length=1,
-                max_length=10,
-                description="List of survey post messages with poll options",
-            )
-
-        # Build platform-specific instructions
-        platform_instructions = ""
-        char_limit = 280  # Default to X/Twitter limit
-
-        if platform == "x":
-            platform_instructions = """
-- Optimize for X (Twitter) format: concise, punchy, engaging
-- Character limit: 280 characters
-- Use hashtags sparingly (1-2 max)
-- Include emojis to increase engagement
-- Make it shareable and retweetable
-- Focus on asking thought-provoking questions
-"""
-            char_limit = 280
-        elif platform == "threads":
-            platform_instructions = """
-- Optimize for Threads format: conversational, engaging
-- Character limit: 500 characters
-- Can be slightly longer and more conversational than X
-- Use emojis naturally
-- Encourage discussion and replies
-- Focus on community engagement
-"""
-            char_limit = 500
-        else:
-            platform_instructions = """
-- Create engaging survey posts suitable for social media
-- Keep posts concise and engaging
-- Include questions that encourage interaction
-- Use emojis appropriately
-- Make posts shareable and discussion-worthy
-"""
-
-        prompt = f"""Generate {count} engaging survey post messages based on the following startup idea context.
-
-Idea Context:
-{idea_context}
-
-{platform_instructions}
-
-Requirements for each post:
-1. Should be engaging and encourage interaction (likes, replies, shares)
-2. Should relate to the idea and invite audience feedback
-3. Should be formatted as a question that works well with a poll
-4. Should be concise and within {char_limit} characters
-5. Should use appropriate emojis (1-3 per post)
-6. Should be professional yet conversational
-7. Each post should have a slightly different angle or focus
-8. Should encourage people to vote in the poll
-
-CRITICAL: Each post MUST include exactly 2-4 poll options. The poll options should:
-- Be concise (max 25 characters each)
-- Be mutually exclusive choices that represent different perspectives, use cases, or opinions
-- Be creative, specific, and contextually relevant to the idea - avoid generic "Yes/No" options
-- Use emojis strategically (1 per option max) to make them more engaging
-- Cover different angles: user personas, use cases, pain points, preferences, or validation aspects
-- Be action-oriented or opinion-based when possible
-- Examples of good options:
-  * For education ideas: "Already using it", "Would try it", "Not for me", "Need more info"
-  * For product ideas: "I'd pay for this", "Free version only", "Not interested", "Tell me more"
-  * For service ideas: "Sign me up!", "Maybe later", "Not my thing", "Sounds interesting"
-- Make each option distinct and meaningful - they should help validate different aspects of the idea
-- Think about what would be most valuable to learn from the poll results
+        key = _request_key("generate_survey_posts", idea_context, platform, count)
+        return await self._coalesce(
+            key, partial(self._generate_survey_posts, idea_context, platform, count)
+        )
 
-Generate {count} unique, engaging survey posts with creative, context-aware poll options that will help validate this startup idea through social media engagement."""
+    async def _generate_survey_posts(
+        self, idea_context: str, platform: Optional[str] = None, count: int = 3
+    ) -> List[Dict[str, str]]:
+        """Generate survey posts without request coalescing."""
+        idea_context = self._truncate(idea_context, IDEA_CONTEXT_MAX_TOKENS)
+        platform_instructions, char_limit = _PLATFORM_PROMPTS.get(
+            platform, _GENERIC_PROMPT
+        )
+        prompt = _SURVEY_TMPL.substitute(
+            count=count,
+            idea_context=idea_context,
+            platform_instructions=platform_instructions,
+            char_limit=char_limit,
+        )
 
         try:
             # Use Responses API with structured outputs
@@ -534,17 +823,16 @@ Generate {count} unique, engaging survey posts with creative, context-aware poll
             posts_response = response.output_parsed
 
             # Convert to list of dicts with IDs and poll options
-            messages = []
-            for idx, post in enumerate(posts_response.posts, start=1):
-                messages.append(
-                    {
-                        "id": str(idx),
-                        "text": post.text,
-                        "poll_options": [
-                            {"text": option.text} for option in post.poll_options
-                        ],
-                    }
-                )
+            messages = [
+                {
+                    "id": f"{idx}",
+                    "text": post.text,
+                    "poll_options": [
+                        {"text": option.text} for option in post.poll_options
+                    ],
+                }
+                for idx, post in enumerate(posts_response.posts, start=1)
+            ]
 
             logger.info(
                 f"Successfully generated {len(messages)} survey posts for platform: {platform or 'generic'}"
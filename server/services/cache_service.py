@@ -0,0 +1,108 @@
+"""Shared Redis cache with zstd-compressed payloads."""
+
+import logging
+from typing import Optional
+
+import redis.asyncio as redis
+import zstandard as zstd
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# zstd level 3 keeps compression cheap while shrinking JSON payloads 3-5x
+ZSTD_LEVEL = 3
+
+# Connect and per-command timeout in seconds; an unreachable or stalled Redis
+# must turn into a quick miss rather than hold up the request
+REDIS_SOCKET_TIMEOUT = 0.5
+
+
+class CacheService:
+    """
+    Best-effort cache shared between workers through Redis.
+
+    Values are compressed with zstd before being stored. When no Redis URL is
+    configured, or Redis is unreachable, lookups miss and writes are dropped
+    so callers fall back to doing the work themselves.
+    """
+
+    def __init__(self):
+        self._redis: Optional[redis.Redis] = None
+        self._compressor = zstd.ZstdCompressor(level=ZSTD_LEVEL)
+        self._decompressor = zstd.ZstdDecompressor()
+
+    def _get_client(self) -> Optional[redis.Redis]:
+        """Create the Redis client on first use (lazy initialization)."""
+        if self._redis is None and settings.redis_url:
+            self._redis = redis.from_url(
+                settings.redis_url,
+                decode_responses=False,
+                socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+                socket_timeout=REDIS_SOCKET_TIMEOUT,
+            )
+        return self._redis
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Decompressed value bytes, or None on a miss or cache error
+        """
+        client = self._get_client()
+        if client is None:
+            return None
+        try:
+            raw = await client.get(key)
+            if raw is None:
+                return None
+            return self._decompressor.decompress(raw)
+        except Exception as e:
+            logger.warning(f"Cache get failed for {key}: {e}")
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        """
+        Store a value with an expiry.
+
+        Args:
+            key: Cache key
+            value: Value bytes to compress and store
+            ttl: Time to live in seconds
+        """
+        client = self._get_client()
+        if client is None:
+            return
+        try:
+            await client.setex(key, ttl, self._compressor.compress(value))
+        except Exception as e:
+            logger.warning(f"Cache set failed for {key}: {e}")
+
+    async def delete(self, key: str) -> None:
+        """
+        Remove a cached value.
+
+        Args:
+            key: Cache key
+        """
+        client = self._get_client()
+        if client is None:
+            return
+        try:
+            await client.delete(key)
+        except Exception as e:
+            logger.warning(f"Cache delete failed for {key}: {e}")
+
+    async def close(self) -> None:
+        """Close the Redis connection pool if one was opened."""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+
+# Singleton instance
+cache_service = CacheService()
@@ -2,10 +2,16 @@
 
 import logging
 import base64
-from typing import Optional, List, Dict, Any
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
 from io import BytesIO
-from PIL import Image
+from PIL import Image, ImageDraw, ImageFont
 import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 from config import settings
 from google import genai
@@ -17,17 +23,131 @@ logger = logging.getLogger(__name__)
 # Timeout constants (10 minutes = 600 seconds)
 GEMINI_API_TIMEOUT = 600
 
+# Startup warmup should never hold up the server for long
+GEMINI_WARMUP_TIMEOUT = 5
+
+# Gemini Files API keeps uploads for 48 hours; re-upload a bit before that
+GEMINI_FILE_TTL = 46 * 3600
+
+# Longest an edit waits for a pending Files API upload before sending inline
+GEMINI_UPLOAD_TIMEOUT = 10
+
+# Flyer images held in memory between edits (each is a few MB)
+FLYER_SESSION_MAX_ENTRIES = 32
+
+# Raw Gemini images kept for repeated identical prompts (each is a few MB)
+GEMINI_RESPONSE_CACHE_MAX_ENTRIES = 16
+
+# Dedicated, bounded pool for CPU-bound PIL work (decode, composite, PNG encode)
+PIL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="pil"
+)
+
+# Flyers are re-encoded on every generation; zlib level 1 is far cheaper than
+# the default 6 for a full A4 image at a modest size cost
+PNG_COMPRESS_LEVEL = 1
+
+# Dashed QR placeholder outline
+DASH_LENGTH = 10
+DASH_GAP = 10
+DASHED_BORDER_PAD = 2
+
+
+def _extract_image_bytes(response: Any) -> Optional[bytes]:
+    """
+    Return the first inline image in a Gemini response.
+
+    Args:
+        response: Gemini generate_content response
+
+    Returns:
+        Image bytes, or None if the response contains no image
+    """
+    # Fast path: image responses are normally one candidate with one image part
+    try:
+        data = response.candidates[0].content.parts[0].inline_data.data
+    except (AttributeError, IndexError, TypeError):
+        data = None
+
+    if not data:
+        data = _find_inline_data(response)
+        if not data:
+            return None
+
+    return base64.b64decode(data) if isinstance(data, str) else data
+
+
+def _find_inline_data(response: Any) -> Optional[Any]:
+    """Sweep every candidate and part for the first inline image data."""
+    for candidate in getattr(response, "candidates", None) or []:
+        content = getattr(candidate, "content", None)
+        for part in getattr(content, "parts", None) or []:
+            data = getattr(getattr(part, "inline_data", None), "data", None)
+            if data:
+                return data
+    return None
+
+
+class FlyerSession:
+    """Latest flyer image of a project, kept in memory across edit turns."""
+
+    def __init__(
+        self, project_id: Optional[int], image_base64: str, image_bytes: bytes
+    ):
+        self.project_id = project_id
+        self.image_base64 = image_base64
+        self.image_bytes = image_bytes
+        # Gemini Files API reference for image_bytes, set once uploaded; the
+        # name identifies the file for deletion once the session is dropped
+        self.file_uri: Optional[str] = None
+        self.file_name: Optional[str] = None
+        self.uploaded_at = 0.0
+        self.upload_task: Optional[asyncio.Task] = None
+
 
 class FlyerService:
     """Service for generating and editing flyers using Gemini API."""
 
     def __init__(self):
-        """Initialize flyer service with Gemini client."""
-        self.gemini_client = genai.Client(api_key=settings.gemini_api_key)
+        """Initialize flyer service; the Gemini client is created on first use."""
+        self._gemini_client: Optional[genai.Client] = None
         self.gemini_model = settings.gemini_model
         self.max_edits = 5
         self.a4_width = 2480
         self.a4_height = 3508
+        # prompt digest -> raw Gemini image bytes; LRU ordered, oldest first
+        self._gemini_response_cache: OrderedDict[bytes, bytes] = OrderedDict()
+        # project_id -> latest flyer session; LRU ordered, oldest first
+        self._sessions: OrderedDict[int, FlyerSession] = OrderedDict()
+        # Running Gemini file deletions, referenced until they finish
+        self._file_deletions: set[asyncio.Task] = set()
+        # Placeholder flyer assets are the same for every project, build them once
+        self._qr_placeholder_size = 400
+        self._dashed_border = self._build_dashed_border(self._qr_placeholder_size)
+        self._font_large, self._font_medium, self._font_small = self._load_fonts()
+        self._placeholder_base = self._build_placeholder_base()
+
+    @property
+    def gemini_client(self) -> genai.Client:
+        """Gemini client, created lazily so importing the service stays cheap."""
+        # Construction is synchronous, so no await can interleave here
+        if self._gemini_client is None:
+            self._gemini_client = genai.Client(api_key=settings.gemini_api_key)
+        return self._gemini_client
+
+    async def warmup(self) -> None:
+        """
+        Open a pooled connection to Gemini before the first real request.
+
+        Best effort: failures and timeouts are logged and ignored.
+        """
+        try:
+            await asyncio.wait_for(
+                self.gemini_client.aio.models.list(), timeout=GEMINI_WARMUP_TIMEOUT
+            )
+            logger.info("Gemini client warmed up")
+        except Exception as e:
+            logger.warning(f"Gemini warmup failed: {e}")
 
     async def generate_initial_flyer(
         self,
@@ -53,6 +173,7 @@ class FlyerService:
             prompt = self._build_initial_flyer_prompt(
                 project_name, project_description, problem_statement
             )
+            prompt_key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
 
             logger.info(f"Generating initial flyer for project {project_id}")
 
@@ -60,12 +181,16 @@ class FlyerService:
             # Using the generate_content method with proper API structure
             # Wrap in timeout to prevent hanging
             try:
-                # Run synchronous Gemini API call in thread pool with timeout
-                loop = asyncio.get_event_loop()
-                response = await asyncio.wait_for(
-                    loop.run_in_executor(
-                        None,
-                        lambda: self.gemini_client.models.generate_content(
+                # Identical prompts reuse the raw Gemini image; QR codes are
+                # embedded per project afterwards
+                image_bytes = self._gemini_response_cache.get(prompt_key)
+                if image_bytes is not None:
+                    self._gemini_response_cache.move_to_end(prompt_key)
+                    logger.info("Reusing cached Gemini flyer for identical prompt")
+                else:
+                    # Use the native async Gemini client so no executor thread is held
+                    response = await asyncio.wait_for(
+                        self.gemini_client.aio.models.generate_content(
                             model=self.gemini_model,
                             contents=[{"role": "user", "parts": [{"text": prompt}]}],
                             config=types.GenerateContentConfig(
@@ -73,45 +198,38 @@ class FlyerService:
                                 # We'll parse the response to extract image data
                             ),
                         ),
-                    ),
-                    timeout=GEMINI_API_TIMEOUT,
-                )
+                        timeout=GEMINI_API_TIMEOUT,
+                    )
 
-                # Extract image from response
-                image_base64 = None
-                if response and hasattr(response, "candidates"):
-                    for candidate in response.candidates:
-                        if hasattr(candidate, "content") and candidate.content:
-                            if hasattr(candidate.content, "parts"):
-                                for part in candidate.content.parts:
-                                    if (
-                                        hasattr(part, "inline_data")
-                                        and part.inline_data
-                                    ):
-                                        image_data = part.inline_data.data
-                                        if isinstance(image_data, bytes):
-                                            image_base64 = base64.b64encode(
-                                                image_data
-                                            ).decode("utf-8")
-                                        elif isinstance(image_data, str):
-                                            image_base64 = image_data
-                                        break
-                        if image_base64:
-                            break
-
-                if not image_base64:
+                    # Extract image from response, keeping raw bytes until the end
+                    image_bytes = _extract_image_bytes(response)
+                    if image_bytes:
+                        self._gemini_response_cache[prompt_key] = image_bytes
+                        if (
+                            len(self._gemini_response_cache)
+                            > GEMINI_RESPONSE_CACHE_MAX_ENTRIES
+                        ):
+                            self._gemini_response_cache.popitem(last=False)
+
+                if not image_bytes:
                     # Fallback: create a placeholder image if API fails
                     logger.warning(
                         "Gemini API did not return image, creating placeholder"
                     )
-                    image_base64 = self._create_placeholder_flyer(
+                    image_bytes = await self._render_placeholder_flyer(
                         project_name, project_description, problem_statement
                     )
 
                 # Embed QR codes into the flyer
-                final_image_base64 = await self._embed_qr_codes(
-                    image_base64, project_id
+                final_image_bytes = await self._embed_qr_codes(image_bytes, project_id)
+
+                # Keep the flyer in memory and upload it once for follow-up
+                # edits, in the background so generation never waits on it
+                final_image_base64 = base64.b64encode(final_image_bytes).decode("utf-8")
+                session = self._store_session(
+                    project_id, final_image_base64, final_image_bytes
                 )
+                self._start_upload(session)
 
                 # Initialize conversation history
                 conversation_history = [
@@ -137,12 +255,10 @@ class FlyerService:
                     f"Gemini API timeout after {GEMINI_API_TIMEOUT}s, creating placeholder"
                 )
                 # Fallback to placeholder
-                image_base64 = self._create_placeholder_flyer(
+                image_bytes = await self._render_placeholder_flyer(
                     project_name, project_description, problem_statement
                 )
-                final_image_base64 = await self._embed_qr_codes(
-                    image_base64, project_id
-                )
+                final_image_bytes = await self._embed_qr_codes(image_bytes, project_id)
                 conversation_history = [
                     {
                         "role": "user",
@@ -154,18 +270,16 @@ class FlyerService:
                     },
                 ]
                 return {
-                    "image_url": final_image_base64,
+                    "image_url": base64.b64encode(final_image_bytes).decode("utf-8"),
                     "conversation_history": conversation_history,
                 }
             except Exception as api_error:
                 logger.error(f"Gemini API error: {api_error}", exc_info=True)
                 # Fallback to placeholder
-                image_base64 = self._create_placeholder_flyer(
+                image_bytes = await self._render_placeholder_flyer(
                     project_name, project_description, problem_statement
                 )
-                final_image_base64 = await self._embed_qr_codes(
-                    image_base64, project_id
-                )
+                final_image_bytes = await self._embed_qr_codes(image_bytes, project_id)
                 conversation_history = [
                     {
                         "role": "user",
@@ -177,7 +291,7 @@ class FlyerService:
                     },
                 ]
                 return {
-                    "image_url": final_image_base64,
+                    "image_url": base64.b64encode(final_image_bytes).decode("utf-8"),
                     "conversation_history": conversation_history,
                 }
 
@@ -190,6 +304,7 @@ class FlyerService:
         current_image_base64: str,
         edit_instruction: str,
         conversation_history: Optional[List[Dict[str, str]]] = None,
+        project_id: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Edit flyer using multi-turn image editing.
@@ -198,6 +313,8 @@ class FlyerService:
             current_image_base64: Base64-encoded current flyer image
             edit_instruction: Natural language instruction for editing
             conversation_history: Previous conversation history
+            project_id: Project ID, used to reuse the in-memory image and its
+                Gemini upload from the previous turn
 
         Returns:
             Dictionary with updated image_url and conversation_history
@@ -215,8 +332,8 @@ class FlyerService:
                 }
             )
 
-            # Decode base64 image
-            image_bytes = base64.b64decode(current_image_base64)
+            # Reuse the previous turn's image when the caller sends it back
+            session = self._get_session(project_id, current_image_base64)
 
             # Create edit request
             # For multi-turn editing, we need to pass the previous image and instruction
@@ -230,62 +347,40 @@ class FlyerService:
 
             # Use Gemini API for image editing (multi-turn)
             try:
-                # Convert image bytes to base64 for API
-                image_base64_for_api = base64.b64encode(image_bytes).decode("utf-8")
+                # Reference the uploaded file when possible instead of inlining
+                image_part = await self._get_image_part(session)
 
-                # Run synchronous Gemini API call in thread pool with timeout
-                loop = asyncio.get_event_loop()
+                # Use the native async Gemini client so no executor thread is held
                 response = await asyncio.wait_for(
-                    loop.run_in_executor(
-                        None,
-                        lambda: self.gemini_client.models.generate_content(
-                            model=self.gemini_model,
-                            contents=[
-                                {
-                                    "role": "user",
-                                    "parts": [
-                                        {
-                                            "inline_data": {
-                                                "mime_type": "image/png",
-                                                "data": image_base64_for_api,
-                                            }
-                                        },
-                                        {"text": edit_prompt},
-                                    ],
-                                }
-                            ],
-                            config=types.GenerateContentConfig(
-                                # Note: Gemini API doesn't support image/png as response_mime_type
-                                # We'll parse the response to extract image data
-                            ),
+                    self.gemini_client.aio.models.generate_content(
+                        model=self.gemini_model,
+                        contents=[
+                            {
+                                "role": "user",
+                                "parts": [image_part, {"text": edit_prompt}],
+                            }
+                        ],
+                        config=types.GenerateContentConfig(
+                            # Note: Gemini API doesn't support image/png as response_mime_type
+                            # We'll parse the response to extract image data
                         ),
                     ),
                     timeout=GEMINI_API_TIMEOUT,
                 )
 
                 # Extract edited image
-                edited_image_base64 = None
-                if response and hasattr(response, "candidates"):
-                    for candidate in response.candidates:
-                        if hasattr(candidate, "content") and candidate.content:
-                            if hasattr(candidate.content, "parts"):
-                                for part in candidate.content.parts:
-                                    if (
-                                        hasattr(part, "inline_data")
-                                        and part.inline_data
-                                    ):
-                                        edited_image_data = part.inline_data.data
-                                        if isinstance(edited_image_data, bytes):
-                                            edited_image_base64 = base64.b64encode(
-                                                edited_image_data
-                                            ).decode("utf-8")
-                                        elif isinstance(edited_image_data, str):
-                                            edited_image_base64 = edited_image_data
-                                        break
-                        if edited_image_base64:
-                            break
-
-                if not edited_image_base64:
+                edited_image_bytes = _extract_image_bytes(response)
+                if edited_image_bytes:
+                    edited_image_base64 = base64.b64encode(edited_image_bytes).decode(
+                        "utf-8"
+                    )
+                    session = self._store_session(
+                        project_id, edited_image_base64, edited_image_bytes
+                    )
+                    # Upload the edited image now so the next edit turn can
+                    # send the file reference instead of inline data
+                    self._start_upload(session)
+                else:
                     # Return original image if editing fails
                     logger.warning(
                         "Gemini API did not return edited image, returning original"
@@ -340,71 +435,255 @@ class FlyerService:
             logger.error(f"Error editing flyer: {e}", exc_info=True)
             raise
 
-    async def _embed_qr_codes(self, flyer_image_base64: str, project_id: int) -> str:
+    def _get_session(
+        self, project_id: Optional[int], image_base64: str
+    ) -> FlyerSession:
         """
-        Embed QR codes into the flyer image at the placeholder locations.
+        Return the flyer session for an image, decoding it only if needed.
 
         Args:
-            flyer_image_base64: Base64-encoded flyer image
-            project_id: Project ID for QR code generation
+            project_id: Project ID, or None for an untracked one-off edit
+            image_base64: Base64-encoded flyer image sent by the caller
 
         Returns:
-            Base64-encoded image with QR codes embedded
+            The cached session if it holds this image, otherwise a new one
         """
+        session = self._sessions.get(project_id) if project_id is not None else None
+        if session is not None and session.image_base64 == image_base64:
+            self._sessions.move_to_end(project_id)
+            return session
+        return self._store_session(
+            project_id, image_base64, base64.b64decode(image_base64)
+        )
+
+    def _store_session(
+        self, project_id: Optional[int], image_base64: str, image_bytes: bytes
+    ) -> FlyerSession:
+        """
+        Record the latest flyer image for a project.
+
+        The uploaded file of the session it replaces, or of the least
+        recently used session it evicts, is deleted from Gemini.
+
+        Args:
+            project_id: Project ID; sessions without one are not kept
+            image_base64: Base64-encoded flyer image
+            image_bytes: The same image as PNG bytes
+
+        Returns:
+            The new session
+        """
+        session = FlyerSession(project_id, image_base64, image_bytes)
+        if project_id is not None:
+            replaced = self._sessions.pop(project_id, None)
+            if replaced is not None:
+                self._release_file(replaced)
+            self._sessions[project_id] = session
+            if len(self._sessions) > FLYER_SESSION_MAX_ENTRIES:
+                _, evicted = self._sessions.popitem(last=False)
+                self._release_file(evicted)
+        return session
+
+    def _release_file(self, session: FlyerSession) -> None:
+        """Delete a session's uploaded Gemini file in the background, if any."""
+        if session.file_name is None:
+            return
+        name = session.file_name
+        session.file_name = None
+        session.file_uri = None
+        task = asyncio.create_task(self._delete_file(name))
+        self._file_deletions.add(task)
+        task.add_done_callback(self._file_deletions.discard)
+
+    async def _delete_file(self, name: str) -> None:
+        """Delete an uploaded Gemini file; failures are logged."""
         try:
-            # Generate QR codes
-            survey_qr_base64, project_qr_base64 = qr_service.generate_flyer_qr_codes(
-                project_id
-            )
+            await self.gemini_client.aio.files.delete(name=name)
+        except Exception as e:
+            # Gemini expires uploads after 48 hours regardless
+            logger.warning(f"Gemini file delete failed for {name}: {e}")
 
-            # Decode flyer image
-            flyer_bytes = base64.b64decode(flyer_image_base64)
-            flyer_image = Image.open(BytesIO(flyer_bytes))
+    def _start_upload(self, session: FlyerSession) -> Optional[asyncio.Task]:
+        """
+        Start uploading a session's image to the Gemini Files API.
 
-            # Decode QR code images
-            survey_qr_bytes = base64.b64decode(survey_qr_base64)
-            project_qr_bytes = base64.b64decode(project_qr_base64)
-            survey_qr_image = Image.open(BytesIO(survey_qr_bytes))
-            project_qr_image = Image.open(BytesIO(project_qr_bytes))
+        Does nothing without a project or while a valid upload exists, and
+        reuses an upload that is still running.
 
-            # Resize QR codes to appropriate size (e.g., 400x400 pixels)
-            qr_size = 400
-            survey_qr_image = survey_qr_image.resize((qr_size, qr_size), Image.LANCZOS)
-            project_qr_image = project_qr_image.resize(
-                (qr_size, qr_size), Image.LANCZOS
+        Args:
+            session: Flyer session holding the image
+
+        Returns:
+            The running upload task, or None if no upload is needed
+        """
+        if session.project_id is None:
+            return None
+        if (
+            session.file_uri is not None
+            and time.monotonic() - session.uploaded_at < GEMINI_FILE_TTL
+        ):
+            return None
+        if session.upload_task is None or session.upload_task.done():
+            # Replace an expiring upload rather than leave it behind
+            self._release_file(session)
+            session.upload_task = asyncio.create_task(self._upload_image(session))
+        return session.upload_task
+
+    async def _upload_image(self, session: FlyerSession) -> None:
+        """
+        Upload a session's image and record its file reference.
+
+        Failures are logged. If the session was replaced or evicted while
+        the upload ran, the new file is deleted right away.
+
+        Args:
+            session: Flyer session holding the image
+        """
+        try:
+            uploaded = await self.gemini_client.aio.files.upload(
+                file=BytesIO(session.image_bytes),
+                config={"mime_type": "image/png"},
             )
+        except Exception as e:
+            logger.warning(f"Gemini file upload failed: {e}")
+            return
+        session.file_uri = uploaded.uri
+        session.file_name = uploaded.name
+        session.uploaded_at = time.monotonic()
+        logger.info(
+            f"Uploaded flyer image for project {session.project_id} to Gemini"
+        )
+        if self._sessions.get(session.project_id) is not session:
+            self._release_file(session)
+
+    async def _get_image_part(self, session: FlyerSession) -> Dict[str, Any]:
+        """
+        Build the Gemini content part for a flyer image.
 
-            # Calculate positions for QR codes
-            # Place them in the bottom corners with some margin
-            margin = 200
-            qr_y = self.a4_height - qr_size - margin
+        The session's image is uploaded through the Files API once; later
+        edits of the same image send only the file reference. Falls back to
+        inline base64 data if there is no project, or the upload fails or
+        takes longer than GEMINI_UPLOAD_TIMEOUT (it keeps running for the
+        next edit).
+
+        Args:
+            session: Flyer session holding the image
+
+        Returns:
+            A file_data or inline_data content part
+        """
+        inline_part = {
+            "inline_data": {"mime_type": "image/png", "data": session.image_base64}
+        }
+        task = self._start_upload(session)
+        if task is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(task), GEMINI_UPLOAD_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Gemini file upload not done after {GEMINI_UPLOAD_TIMEOUT}s, "
+                    "sending inline"
+                )
+                return inline_part
+        if session.file_uri is None:
+            return inline_part
 
-            # Left QR code (survey)
-            left_qr_x = margin
-            # Right QR code (project)
-            right_qr_x = self.a4_width - qr_size - margin
+        return {
+            "file_data": {"mime_type": "image/png", "file_uri": session.file_uri}
+        }
 
-            # Paste QR codes onto flyer
-            flyer_image.paste(survey_qr_image, (left_qr_x, qr_y))
-            flyer_image.paste(project_qr_image, (right_qr_x, qr_y))
+    async def _embed_qr_codes(self, flyer_image_bytes: bytes, project_id: int) -> bytes:
+        """
+        Embed QR codes into the flyer image at the placeholder locations.
 
-            # Convert back to base64
-            output_buffer = BytesIO()
-            flyer_image.save(output_buffer, format="PNG")
-            output_bytes = output_buffer.getvalue()
-            output_base64 = base64.b64encode(output_bytes).decode("utf-8")
+        Args:
+            flyer_image_bytes: Flyer image bytes
+            project_id: Project ID for QR code generation
+
+        Returns:
+            PNG image bytes with QR codes embedded
+        """
+        try:
+            # Generate QR codes directly as PIL images
+            (
+                survey_qr_image,
+                project_qr_image,
+            ) = await qr_service.generate_flyer_qr_images(
+                project_id, executor=PIL_EXECUTOR
+            )
+
+            # PIL decode, resize and PNG encode are CPU-bound; keep them off the loop
+            output_bytes = await asyncio.get_running_loop().run_in_executor(
+                PIL_EXECUTOR,
+                self._embed_qr_codes_sync,
+                flyer_image_bytes,
+                survey_qr_image,
+                project_qr_image,
+            )
 
             logger.info(f"Embedded QR codes into flyer for project {project_id}")
 
-            return output_base64
+            return output_bytes
 
         except Exception as e:
             logger.error(f"Error embedding QR codes: {e}", exc_info=True)
             # Return original image if QR embedding fails
-            return flyer_image_base64
+            return flyer_image_bytes
 
-    def _build_initial_flyer_prompt(
+    def _embed_qr_codes_sync(
         self,
+        flyer_image_bytes: bytes,
+        survey_qr_image: Image.Image,
+        project_qr_image: Image.Image,
+    ) -> bytes:
+        """
+        Paste the QR code images onto the flyer and encode it as PNG.
+
+        Args:
+            flyer_image_bytes: Flyer image bytes
+            survey_qr_image: Survey link QR code
+            project_qr_image: Project link QR code
+
+        Returns:
+            PNG image bytes with QR codes embedded
+        """
+        # Open flyer image
+        flyer_image = Image.open(BytesIO(flyer_image_bytes))
+
+        # qr_service already renders at 400x400; QR modules are discrete, so
+        # fall back to NEAREST rather than LANCZOS if the size ever differs
+        qr_size = 400
+        if survey_qr_image.size != (qr_size, qr_size):
+            survey_qr_image = survey_qr_image.resize((qr_size, qr_size), Image.NEAREST)
+        if project_qr_image.size != (qr_size, qr_size):
+            project_qr_image = project_qr_image.resize(
+                (qr_size, qr_size), Image.NEAREST
+            )
+
+        # Calculate positions for QR codes
+        # Place them in the bottom corners with some margin
+        margin = 200
+        qr_y = self.a4_height - qr_size - margin
+
+        # Left QR code (survey)
+        left_qr_x = margin
+        # Right QR code (project)
+        right_qr_x = self.a4_width - qr_size - margin
+
+        # Paste QR codes onto flyer
+        flyer_image.paste(survey_qr_image, (left_qr_x, qr_y))
+        flyer_image.paste(project_qr_image, (right_qr_x, qr_y))
+
+        # Convert back to PNG bytes
+        output_buffer = BytesIO()
+        flyer_image.save(
+            output_buffer, format="PNG", compress_level=PNG_COMPRESS_LEVEL
+        )
+        return output_buffer.getvalue()
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _build_initial_flyer_prompt(
         project_name: str,
         project_description: str,
         problem_statement: str,
@@ -442,12 +721,123 @@ The flyer should be designed to attract people to scan the QR codes and engage w
 """
         return prompt
 
-    def _create_placeholder_flyer(
+    @staticmethod
+    def _build_dashed_border(size: int) -> Image.Image:
+        """
+        Render a dashed square outline on a transparent tile.
+
+        The tile is padded by DASHED_BORDER_PAD on each side so the line
+        width is not clipped; paste it at the rectangle's top-left corner
+        minus the pad.
+
+        Args:
+            size: Side length of the dashed rectangle in pixels
+
+        Returns:
+            RGBA image containing only the dashed outline
+        """
+        pad = DASHED_BORDER_PAD
+        tile = Image.new("RGBA", (size + 2 * pad, size + 2 * pad), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(tile)
+
+        # PIL ImageDraw doesn't support dash parameter, so build the segments
+        x1, y1 = pad, pad
+        x2, y2 = pad + size, pad + size
+        stride = DASH_LENGTH + DASH_GAP
+        segments = []
+        for x in range(x1, x2, stride):
+            end_x = min(x + DASH_LENGTH, x2)
+            segments.append(((x, y1), (end_x, y1)))
+            segments.append(((x, y2), (end_x, y2)))
+        for y in range(y1, y2, stride):
+            end_y = min(y + DASH_LENGTH, y2)
+            segments.append(((x1, y), (x1, end_y)))
+            segments.append(((x2, y), (x2, end_y)))
+
+        for segment in segments:
+            draw.line(segment, fill="gray", width=3)
+        return tile
+
+    @staticmethod
+    def _load_fonts() -> Tuple[Any, Any, Any]:
+        """
+        Load the large, medium and small placeholder fonts.
+
+        Returns:
+            Tuple of (font_large, font_medium, font_small)
+        """
+        # Try to use a default font, fallback to basic if not available
+        try:
+            return (
+                ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 80),
+                ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 50),
+                ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 40),
+            )
+        except (OSError, IOError):
+            default_font = ImageFont.load_default()
+            return default_font, default_font, default_font
+
+    def _build_placeholder_base(self) -> Image.Image:
+        """
+        Render the project-independent part of the placeholder flyer.
+
+        Returns:
+            White A4 image with both dashed QR code placeholders drawn
+        """
+        img = Image.new("RGB", (self.a4_width, self.a4_height), color="white")
+        draw = ImageDraw.Draw(img)
+
+        margin = 200
+        qr_size = self._qr_placeholder_size
+        qr_y = self.a4_height - qr_size - margin
+        border_pad = DASHED_BORDER_PAD
+
+        # Left (survey) and right (project) placeholders
+        for qr_x in (margin, self.a4_width - qr_size - margin):
+            img.paste(
+                self._dashed_border,
+                (qr_x - border_pad, qr_y - border_pad),
+                mask=self._dashed_border,
+            )
+            draw.text(
+                (qr_x + 50, qr_y + qr_size // 2 - 20),
+                "QR Code",
+                fill="gray",
+                font=self._font_small,
+            )
+        return img
+
+    async def _render_placeholder_flyer(
         self,
         project_name: str,
         project_description: str,
         problem_statement: str,
-    ) -> str:
+    ) -> bytes:
+        """
+        Create the placeholder flyer on the PIL executor.
+
+        Args:
+            project_name: Name of the project
+            project_description: Description of the project
+            problem_statement: Problem statement
+
+        Returns:
+            PNG placeholder image bytes
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            PIL_EXECUTOR,
+            self._create_placeholder_flyer_bytes,
+            project_name,
+            project_description,
+            problem_statement,
+        )
+
+    def _create_placeholder_flyer_bytes(
+        self,
+        project_name: str,
+        project_description: str,
+        problem_statement: str,
+    ) -> bytes:
         """
         Create a placeholder flyer image if Gemini API fails.
 
@@ -457,137 +847,46 @@ The flyer should be designed to attract people to scan the QR codes and engage w
             problem_statement: Problem statement
 
         Returns:
-            Base64-encoded placeholder image
+            PNG placeholder image bytes
         """
         try:
-            # Create a simple placeholder image
-            img = Image.new("RGB", (self.a4_width, self.a4_height), color="white")
-            from PIL import ImageDraw, ImageFont
-
+            # Start from the cached template with the QR placeholders drawn
+            img = self._placeholder_base.copy()
             draw = ImageDraw.Draw(img)
 
-            # Try to use a default font, fallback to basic if not available
-            try:
-                font_large = ImageFont.truetype(
-                    "/System/Library/Fonts/Helvetica.ttc", 80
-                )
-                font_medium = ImageFont.truetype(
-                    "/System/Library/Fonts/Helvetica.ttc", 50
-                )
-                font_small = ImageFont.truetype(
-                    "/System/Library/Fonts/Helvetica.ttc", 40
-                )
-            except (OSError, IOError):
-                font_large = ImageFont.load_default()
-                font_medium = ImageFont.load_default()
-                font_small = ImageFont.load_default()
-
             # Draw project name
-            draw.text((200, 300), project_name, fill="black", font=font_large)
+            draw.text((200, 300), project_name, fill="black", font=self._font_large)
 
             # Draw description
             y_pos = 500
             for line in project_description[:200].split("\n"):
-                draw.text((200, y_pos), line[:80], fill="gray", font=font_medium)
+                draw.text(
+                    (200, y_pos), line[:80], fill="gray", font=self._font_medium
+                )
                 y_pos += 60
 
             # Draw problem statement
             y_pos += 100
-            draw.text((200, y_pos), "Problem:", fill="black", font=font_medium)
+            draw.text((200, y_pos), "Problem:", fill="black", font=self._font_medium)
             y_pos += 70
             for line in problem_statement[:300].split("\n"):
-                draw.text((200, y_pos), line[:80], fill="darkblue", font=font_small)
+                draw.text(
+                    (200, y_pos), line[:80], fill="darkblue", font=self._font_small
+                )
                 y_pos += 50
 
-            # Draw QR code placeholders
-            margin = 200
-            qr_size = 400
-            qr_y = self.a4_height - qr_size - margin
-
-            # Left placeholder - draw dashed rectangle manually
-            # PIL ImageDraw doesn't support dash parameter, so we draw it manually
-            dash_length = 10
-            gap_length = 10
-            x1, y1 = margin, qr_y
-            x2, y2 = margin + qr_size, qr_y + qr_size
-            
-            # Top edge
-            x = x1
-            while x < x2:
-                draw.line([(x, y1), (min(x + dash_length, x2), y1)], fill="gray", width=3)
-                x += dash_length + gap_length
-            
-            # Bottom edge
-            x = x1
-            while x < x2:
-                draw.line([(x, y2), (min(x + dash_length, x2), y2)], fill="gray", width=3)
-                x += dash_length + gap_length
-            
-            # Left edge
-            y = y1
-            while y < y2:
-                draw.line([(x1, y), (x1, min(y + dash_length, y2))], fill="gray", width=3)
-                y += dash_length + gap_length
-            
-            # Right edge
-            y = y1
-            while y < y2:
-                draw.line([(x2, y), (x2, min(y + dash_length, y2))], fill="gray", width=3)
-                y += dash_length + gap_length
-            draw.text(
-                (margin + 50, qr_y + qr_size // 2 - 20),
-                "QR Code",
-                fill="gray",
-                font=font_small,
-            )
-
-            # Right placeholder - draw dashed rectangle manually
-            right_x = self.a4_width - qr_size - margin
-            x1, y1 = right_x, qr_y
-            x2, y2 = right_x + qr_size, qr_y + qr_size
-            
-            # Top edge
-            x = x1
-            while x < x2:
-                draw.line([(x, y1), (min(x + dash_length, x2), y1)], fill="gray", width=3)
-                x += dash_length + gap_length
-            
-            # Bottom edge
-            x = x1
-            while x < x2:
-                draw.line([(x, y2), (min(x + dash_length, x2), y2)], fill="gray", width=3)
-                x += dash_length + gap_length
-            
-            # Left edge
-            y = y1
-            while y < y2:
-                draw.line([(x1, y), (x1, min(y + dash_length, y2))], fill="gray", width=3)
-                y += dash_length + gap_length
-            
-            # Right edge
-            y = y1
-            while y < y2:
-                draw.line([(x2, y), (x2, min(y + dash_length, y2))], fill="gray", width=3)
-                y += dash_length + gap_length
-            draw.text(
-                (right_x + 50, qr_y + qr_size // 2 - 20),
-                "QR Code",
-                fill="gray",
-                font=font_small,
-            )
-
-            # Convert to base64
+            # Convert to PNG bytes
             buffer = BytesIO()
-            img.save(buffer, format="PNG")
-            return base64.b64encode(buffer.getvalue()).decode("utf-8")
+            img.save(buffer, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+            return buffer.getvalue()
 
         except Exception as e:
             logger.error(f"Error creating placeholder flyer: {e}", exc_info=True)
             # Return a minimal white image
             img = Image.new("RGB", (self.a4_width, self.a4_height), color="white")
             buffer = BytesIO()
-            img.save(buffer, format="PNG")
-            return base64.b64encode(buffer.getvalue()).decode("utf-8")
+            img.save(buffer, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+            return buffer.getvalue()
 
 
 # Singleton instance
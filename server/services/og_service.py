@@ -1,14 +1,18 @@
 """Service for fetching OG images from URLs."""
 
-import asyncio
 import logging
 from typing import Optional
 from urllib.parse import urljoin, urlparse
-from urllib.request import Request, urlopen
 from html.parser import HTMLParser
 
+import httpx
+
 logger = logging.getLogger(__name__)
 
+# OG tags live in <head>, so only the start of the page is downloaded
+OG_MAX_BYTES = 16_384
+OG_READ_CHUNK = 8192
+
 
 class OGImageParser(HTMLParser):
     """HTML parser to extract OG image URL from meta tags."""
@@ -31,8 +35,14 @@ class OGImageParser(HTMLParser):
 class OGImageService:
     """Service for fetching OG images from URLs."""
 
-    def __init__(self):
-        self._client = None
+    def __init__(self, client: httpx.AsyncClient):
+        """
+        Initialize OG image service.
+
+        Args:
+            client: Shared HTTP client; it is not closed by this service
+        """
+        self._client = client
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -42,12 +52,15 @@ class OGImageService:
         """Async context manager exit."""
         return None
 
-    async def fetch_og_image(self, url: str) -> Optional[str]:
+    async def fetch_og_image(
+        self, url: str, max_bytes: int = OG_MAX_BYTES
+    ) -> Optional[str]:
         """
         Fetch OG image URL from a webpage.
 
         Args:
             url: The URL of the webpage to fetch OG image from
+            max_bytes: Maximum number of bytes of the page to download
 
         Returns:
             OG image URL if found, None otherwise
@@ -59,9 +72,7 @@ class OGImageService:
                 logger.warning(f"Invalid URL format: {url}")
                 return None
 
-            # Fetch HTML content asynchronously
-            loop = asyncio.get_event_loop()
-            html_content = await loop.run_in_executor(None, self._fetch_html, url)
+            html_content = await self._fetch_html(url, max_bytes)
 
             if not html_content:
                 return None
@@ -83,33 +94,47 @@ class OGImageService:
             logger.warning(f"Error fetching OG image from {url}: {e}")
             return None
 
-    def _fetch_html(self, url: str, timeout: int = 10) -> Optional[str]:
+    async def _fetch_html(
+        self, url: str, max_bytes: int = OG_MAX_BYTES, timeout: int = 10
+    ) -> Optional[str]:
         """
-        Synchronously fetch HTML content from URL.
+        Fetch the beginning of a page's HTML content.
+
+        Asks the server for the first max_bytes via a Range header and stops
+        reading early once </head> has been seen, since servers may ignore
+        the range and send the full body.
 
         Args:
             url: The URL to fetch
+            max_bytes: Maximum number of bytes to read
             timeout: Request timeout in seconds
 
         Returns:
             HTML content as string, or None if fetch fails
         """
         try:
-            # Create request with user agent to avoid blocking
-            req = Request(
-                url,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                },
-            )
-
-            with urlopen(req, timeout=timeout) as response:
-                # Read content and decode
-                content = response.read()
+            # Send a user agent to avoid blocking
+            headers = {
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                "Range": f"bytes=0-{max_bytes - 1}",
+            }
+            async with self._client.stream(
+                "GET", url, headers=headers, timeout=timeout, follow_redirects=True
+            ) as response:
+                response.raise_for_status()
+
+                # Read in chunks until </head> or the byte budget is reached
+                content = bytearray()
+                async for chunk in response.aiter_bytes(OG_READ_CHUNK):
+                    content += chunk
+                    # Look back a few bytes so a tag split across chunks is found
+                    tail = content[-(len(chunk) + 6) :]
+                    if len(content) >= max_bytes or b"</head>" in tail.lower():
+                        break
+
                 # Try to detect encoding from response headers
-                encoding = response.headers.get_content_charset() or "utf-8"
-                html_content = content.decode(encoding, errors="ignore")
-                return html_content
+                encoding = response.charset_encoding or "utf-8"
+                return content[:max_bytes].decode(encoding, errors="ignore")
 
         except Exception as e:
             logger.debug(f"Failed to fetch HTML from {url}: {e}")
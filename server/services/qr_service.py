@@ -1,47 +1,102 @@
 """QR code generation service for flyers."""
 
+import asyncio
 import qrcode
 from qrcode.image.pil import PilImage
 from io import BytesIO
+from PIL import Image
 import base64
-from typing import Tuple
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# QR content depends only on (project_id, base_url), so results are cached.
+# PIL images are ~160 KB each in memory.
+QR_IMAGE_CACHE_MAX_ENTRIES = 128
+
 
 class QRCodeService:
     """Service for generating QR codes for flyers."""
 
     def __init__(self):
         """Initialize QR code service."""
-        pass
+        # One reusable QRCode per thread; QRCode instances are not thread-safe
+        self._local = threading.local()
+        # (project_id, base_url) -> QR pair; LRU ordered, oldest first.
+        # Only touched from the event loop, so no locking is needed.
+        self._qr_image_cache: OrderedDict[
+            Tuple[int, str], Tuple[Image.Image, Image.Image]
+        ] = OrderedDict()
+
+    def _get_qr(self) -> qrcode.QRCode:
+        """
+        Return this thread's QRCode instance, reset for new data.
 
-    def generate_qr_code(self, data: str, size: int = 300) -> bytes:
+        Returns:
+            A cleared QRCode instance
         """
-        Generate a QR code image as PNG bytes.
+        qr = getattr(self._local, "qr", None)
+        if qr is None:
+            qr = qrcode.QRCode(
+                version=1,
+                error_correction=qrcode.constants.ERROR_CORRECT_H,  # High error correction for print
+                box_size=10,
+                border=4,
+            )
+            self._local.qr = qr
+        else:
+            qr.clear()
+            # make(fit=True) searches upward from the current version
+            qr.version = 1
+        return qr
+
+    def generate_qr_image(self, data: str, size: int = 300) -> Image.Image:
+        """
+        Generate a QR code as a PIL image.
 
         Args:
             data: The data to encode in the QR code
             size: The size of the QR code image in pixels (default: 300)
 
         Returns:
-            PNG image bytes
+            PIL image of the QR code
         """
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_H,  # High error correction for print
-            box_size=10,
-            border=4,
-        )
+        qr = self._get_qr()
         qr.add_data(data)
         qr.make(fit=True)
 
-        img = qr.make_image(fill_color="black", back_color="white")
+        # Render at the largest whole-pixel module size that fits, so no
+        # resampling is needed and the modules stay crisp
+        modules = qr.modules_count + 2 * qr.border
+        qr.box_size = max(1, size // modules)
+        img = qr.make_image(fill_color="black", back_color="white").get_image()
+
+        if img.width > size:
+            return img.resize((size, size), resample=Image.NEAREST)
+        if img.width < size:
+            # Pad the leftover pixels into the quiet zone
+            padded = Image.new(img.mode, (size, size), "white")
+            offset = (size - img.width) // 2
+            padded.paste(img, (offset, offset))
+            return padded
+        return img
+
+    def generate_qr_code(self, data: str, size: int = 300) -> bytes:
+        """
+        Generate a QR code image as PNG bytes.
+
+        Args:
+            data: The data to encode in the QR code
+            size: The size of the QR code image in pixels (default: 300)
 
-        # Resize to desired size
-        from PIL import Image
-        img = img.resize((size, size), resample=Image.LANCZOS)
+        Returns:
+            PNG image bytes
+        """
+        img = self.generate_qr_image(data, size)
 
         # Convert to bytes
         buffer = BytesIO()
@@ -62,32 +117,53 @@ class QRCodeService:
         qr_bytes = self.generate_qr_code(data, size)
         return base64.b64encode(qr_bytes).decode("utf-8")
 
-    def generate_flyer_qr_codes(
-        self, project_id: int, base_url: str = "https://postul.app"
-    ) -> Tuple[str, str]:
+    async def generate_flyer_qr_images(
+        self,
+        project_id: int,
+        base_url: str = "https://postul.app",
+        executor: Optional[Executor] = None,
+    ) -> Tuple[Image.Image, Image.Image]:
         """
-        Generate two QR codes for a flyer:
-        1. Survey link (project-specific survey URL)
-        2. Project detail link (deep link to project)
+        Generate the two flyer QR codes as PIL images, skipping PNG encoding.
 
         Args:
             project_id: The project ID
             base_url: Base URL for the application (default: https://postul.app)
+            executor: Pool the two renders run on (default: the loop's
+                default executor); pass the caller's bounded PIL pool so QR
+                rendering shares its concurrency limit
 
         Returns:
-            Tuple of (survey_qr_base64, project_qr_base64)
+            Tuple of (survey_qr_image, project_qr_image); callers must not
+            modify them in place since they are shared through the cache
         """
-        # Generate survey link QR code
-        # Using deep link format: postul://survey/{project_id}
-        survey_url = f"{base_url}/survey/{project_id}"
-        survey_qr = self.generate_qr_code_base64(survey_url, size=400)
+        cache_key = (project_id, base_url)
+        cached = self._qr_image_cache.get(cache_key)
+        if cached is not None:
+            self._qr_image_cache.move_to_end(cache_key)
+            return cached
+
+        loop = asyncio.get_running_loop()
+        survey_qr, project_qr = await asyncio.gather(
+            loop.run_in_executor(
+                executor,
+                self.generate_qr_image,
+                f"{base_url}/survey/{project_id}",
+                400,
+            ),
+            loop.run_in_executor(
+                executor,
+                self.generate_qr_image,
+                f"{base_url}/project/{project_id}",
+                400,
+            ),
+        )
 
-        # Generate project detail link QR code
-        # Using deep link format: postul://project/{project_id}
-        project_url = f"{base_url}/project/{project_id}"
-        project_qr = self.generate_qr_code_base64(project_url, size=400)
+        self._qr_image_cache[cache_key] = (survey_qr, project_qr)
+        if len(self._qr_image_cache) > QR_IMAGE_CACHE_MAX_ENTRIES:
+            self._qr_image_cache.popitem(last=False)
 
-        logger.info(f"Generated QR codes for project {project_id}")
+        logger.info(f"Generated QR images for project {project_id}")
         return survey_qr, project_qr
 
 
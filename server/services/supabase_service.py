@@ -1,12 +1,20 @@
 from supabase import create_client, Client
-from typing import Optional
+from collections import OrderedDict
+from typing import Optional, Tuple
+import hashlib
 import jwt
 import logging
+import time
 
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Verified token cache bounds
+TOKEN_CACHE_MAX_ENTRIES = 1024
+# Treat cached tokens as expired slightly early to avoid clock-edge acceptance
+TOKEN_EXPIRY_LEEWAY = 5
+
 
 class SupabaseService:
     """Service for Supabase authentication and user management."""
@@ -14,6 +22,8 @@ class SupabaseService:
     def __init__(self):
         self.client: Optional[Client] = None
         self._initialized = False
+        # token hash -> (payload, exp); LRU ordered, oldest first
+        self._token_cache: OrderedDict[str, Tuple[dict, float]] = OrderedDict()
     
     def _ensure_initialized(self):
         """Ensure Supabase client is initialized (lazy initialization)."""
@@ -31,6 +41,7 @@ class SupabaseService:
         Verify Supabase JWT token and return decoded payload.
         
         Supabase uses HS256 algorithm with the JWT secret for token verification.
+        Verified payloads are cached until shortly before their expiry.
         
         Args:
             token: JWT token string
@@ -42,6 +53,15 @@ class SupabaseService:
             jwt.InvalidTokenError: If token is invalid or expired
         """
         self._ensure_initialized()
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+        cached = self._token_cache.get(cache_key)
+        if cached is not None:
+            payload, exp = cached
+            if exp > time.time() + TOKEN_EXPIRY_LEEWAY:
+                self._token_cache.move_to_end(cache_key)
+                return payload
+            del self._token_cache[cache_key]
+        
         try:
             # Verify and decode the token using Supabase JWT secret
             payload = jwt.decode(
@@ -51,6 +71,13 @@ class SupabaseService:
                 audience="authenticated",
             )
             
+            # Only tokens with an expiry can be cached safely
+            exp = payload.get("exp")
+            if isinstance(exp, (int, float)):
+                self._token_cache[cache_key] = (payload, float(exp))
+                if len(self._token_cache) > TOKEN_CACHE_MAX_ENTRIES:
+                    self._token_cache.popitem(last=False)
+            
             return payload
         except jwt.ExpiredSignatureError:
             logger.warning("Token has expired")
@@ -1,19 +1,42 @@
 """
 Supertonic TTS Helper Module
 Based on https://github.com/supertone-inc/supertonic/blob/main/py/helper.py
+
+FP16 models: when running on a GPU execution provider and precision is
+"fp16", `<name>.fp16.onnx` siblings are loaded in place of the FP32 models
+if present, and TensorRT builds FP16 engines (FP32 engines otherwise).
+Generate the FP16 models once with `uv run convert-supertonic-fp16`
+(scripts/convert_supertonic_fp16.py), which needs `onnx` and
+`onnxconverter-common` installed.
 """
 
 import json
+import logging
 import os
+import queue
 import re
+import threading
 from contextlib import contextmanager
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
 from unicodedata import normalize
 import time
 
 import numpy as np
 import onnxruntime as ort
 
+logger = logging.getLogger(__name__)
+
+# Sentence boundaries (period, question mark, exclamation mark followed by
+# space), excluding common abbreviations
+SENTENCE_BOUNDARY_PATTERN = r"(?<!Mr\.)(?<!Mrs\.)(?<!Ms\.)(?<!Dr\.)(?<!Prof\.)(?<!Sr\.)(?<!Jr\.)(?<!Ph\.D\.)(?<!etc\.)(?<!e\.g\.)(?<!i\.e\.)(?<!vs\.)(?<!Inc\.)(?<!Ltd\.)(?<!Co\.)(?<!Corp\.)(?<!St\.)(?<!Ave\.)(?<!Blvd\.)(?<!\b[A-Z]\.)(?<=[.!?])\s+"
+
+# Most text chunks run through the models in one padded batch; larger batches
+# are split so one long request cannot inflate a batch's memory and latency
+BATCH_MAX_ROWS = 16
+
+# Sentences whose latents may be computed ahead of the vocoder when streaming
+STREAM_LOOKAHEAD = 2
+
 
 class UnicodeProcessor:
     """Processes Unicode text for TTS input."""
@@ -175,6 +198,7 @@ class TextToSpeech:
         text_enc_ort: ort.InferenceSession,
         vector_est_ort: ort.InferenceSession,
         vocoder_ort: ort.InferenceSession,
+        use_io_binding: bool = False,
     ):
         self.cfgs = cfgs
         self.text_processor = text_processor
@@ -186,6 +210,14 @@ class TextToSpeech:
         self.base_chunk_size = cfgs["ae"]["base_chunk_size"]
         self.chunk_compress_factor = cfgs["ttl"]["chunk_compress_factor"]
         self.ldim = cfgs["ttl"]["latent_dim"]
+        # With IOBinding the denoising loop keeps tensors on the session's
+        # device instead of copying them to and from the host every step
+        self.use_io_binding = use_io_binding
+        gpu_providers = {"TensorrtExecutionProvider", "CUDAExecutionProvider"}
+        on_gpu = bool(gpu_providers & set(vector_est_ort.get_providers()))
+        self.io_device = "cuda" if on_gpu else "cpu"
+        self.vector_est_output = vector_est_ort.get_outputs()[0].name
+        self.vocoder_output = vocoder_ort.get_outputs()[0].name
 
     def sample_noisy_latent(
         self, duration: np.ndarray
@@ -203,9 +235,21 @@ class TextToSpeech:
         noisy_latent = noisy_latent * latent_mask
         return noisy_latent, latent_mask
 
-    def _infer(
-        self, text_list: list[str], style: Style, total_step: int, speed: float = 1.05
-    ) -> Tuple[np.ndarray, np.ndarray]:
+    def _infer_latent(
+        self,
+        text_list: list[str],
+        style: Style,
+        total_step: int,
+        speed: float | np.ndarray = 1.05,
+    ) -> Tuple[np.ndarray | ort.OrtValue, np.ndarray]:
+        """
+        Run everything up to the vocoder: duration prediction, text encoding
+        and the denoising loop.
+
+        Returns:
+            Final latent (left on the device as an OrtValue with IOBinding)
+            and predicted durations in seconds
+        """
         assert len(text_list) == style.ttl.shape[0], (
             "Number of texts must match number of style vectors"
         )
@@ -221,6 +265,11 @@ class TextToSpeech:
         )
         xt, latent_mask = self.sample_noisy_latent(dur_onnx)
         total_step_np = np.array([total_step] * bsz, dtype=np.float32)
+        if self.use_io_binding:
+            latent = self._denoise_bound(
+                xt, text_emb_onnx, style, text_mask, latent_mask, total_step_np
+            )
+            return latent, dur_onnx
         for step in range(total_step):
             current_step = np.array([step] * bsz, dtype=np.float32)
             xt, *_ = self.vector_est_ort.run(
@@ -235,8 +284,67 @@ class TextToSpeech:
                     "total_step": total_step_np,
                 },
             )
-        wav, *_ = self.vocoder_ort.run(None, {"latent": xt})
-        return wav, dur_onnx
+        return xt, dur_onnx
+
+    def _decode(self, latent: np.ndarray | ort.OrtValue) -> np.ndarray:
+        """Run the vocoder on a latent from `_infer_latent`."""
+        if isinstance(latent, ort.OrtValue):
+            vocoder_binding = self.vocoder_ort.io_binding()
+            vocoder_binding.bind_ortvalue_input("latent", latent)
+            vocoder_binding.bind_output(self.vocoder_output, self.io_device)
+            self.vocoder_ort.run_with_iobinding(vocoder_binding)
+            return vocoder_binding.copy_outputs_to_cpu()[0]
+        wav, *_ = self.vocoder_ort.run(None, {"latent": latent})
+        return wav
+
+    def _infer(
+        self,
+        text_list: list[str],
+        style: Style,
+        total_step: int,
+        speed: float | np.ndarray = 1.05,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        latent, dur_onnx = self._infer_latent(text_list, style, total_step, speed)
+        return self._decode(latent), dur_onnx
+
+    def _denoise_bound(
+        self,
+        xt: np.ndarray,
+        text_emb: np.ndarray,
+        style: Style,
+        text_mask: np.ndarray,
+        latent_mask: np.ndarray,
+        total_step_np: np.ndarray,
+    ) -> ort.OrtValue:
+        """
+        Run the denoising loop through IOBinding.
+
+        Conditioning tensors are copied to the device once and each step's
+        latent output is bound directly as the next step's input; the final
+        latent stays on the device for `_decode`.
+        """
+        device = self.io_device
+
+        def to_device(arr: np.ndarray) -> ort.OrtValue:
+            return ort.OrtValue.ortvalue_from_numpy(arr, device, 0)
+
+        binding = self.vector_est_ort.io_binding()
+        binding.bind_ortvalue_input("text_emb", to_device(text_emb))
+        binding.bind_ortvalue_input("style_ttl", to_device(style.ttl))
+        binding.bind_ortvalue_input("text_mask", to_device(text_mask))
+        binding.bind_ortvalue_input("latent_mask", to_device(latent_mask))
+        binding.bind_ortvalue_input("total_step", to_device(total_step_np))
+
+        bsz = xt.shape[0]
+        xt_value = to_device(xt)
+        for step in range(int(total_step_np[0])):
+            current_step = np.full(bsz, step, dtype=np.float32)
+            binding.bind_ortvalue_input("noisy_latent", xt_value)
+            binding.bind_ortvalue_input("current_step", to_device(current_step))
+            binding.bind_output(self.vector_est_output, device)
+            self.vector_est_ort.run_with_iobinding(binding)
+            xt_value = binding.get_outputs()[0]
+        return xt_value
 
     def __call__(
         self,
@@ -265,6 +373,140 @@ class TextToSpeech:
                 dur_cat += dur_onnx + silence_duration
         return wav_cat, dur_cat
 
+    def batch(
+        self,
+        texts: list[str],
+        styles: list[Style],
+        total_step: int,
+        speeds: list[float],
+        silence_duration: float = 0.3,
+    ) -> list[np.ndarray]:
+        """
+        Synthesize several single-speaker requests in one padded batch.
+
+        Each text is split with chunk_text and the chunks run through the
+        models together, at most BATCH_MAX_ROWS at a time; every chunk is
+        trimmed to its predicted duration and re-joined with the other chunks
+        of the same request.
+
+        Args:
+            texts: Input texts, one per request
+            styles: Single-speaker voice style per request
+            total_step: Denoising steps shared by the whole batch
+            speeds: Speech speed multiplier per request
+
+        Returns:
+            One (1, n_samples) waveform per input text
+        """
+        owners = []
+        chunks = []
+        for i, text in enumerate(texts):
+            for text_chunk in chunk_text(text):
+                owners.append(i)
+                chunks.append(text_chunk)
+
+        silence = np.zeros(
+            (1, int(silence_duration * self.sample_rate)), dtype=np.float32
+        )
+        pieces: list[list[np.ndarray]] = [[] for _ in texts]
+        for start in range(0, len(chunks), BATCH_MAX_ROWS):
+            rows = owners[start : start + BATCH_MAX_ROWS]
+            style = Style(
+                np.concatenate([styles[i].ttl for i in rows]),
+                np.concatenate([styles[i].dp for i in rows]),
+            )
+            speed = np.array([speeds[i] for i in rows], dtype=np.float32)
+            wav, dur_onnx = self._infer(
+                chunks[start : start + BATCH_MAX_ROWS], style, total_step, speed
+            )
+            for row, owner in enumerate(rows):
+                if pieces[owner]:
+                    pieces[owner].append(silence)
+                n_samples = int(dur_onnx[row] * self.sample_rate)
+                pieces[owner].append(wav[row : row + 1, :n_samples])
+        return [np.concatenate(p, axis=1) for p in pieces]
+
+    def stream(
+        self,
+        text: str,
+        style: Style,
+        total_step: int,
+        speed: float = 1.05,
+        silence_duration: float = 0.3,
+        fade_duration: float = 0.005,
+    ) -> Iterator[np.ndarray]:
+        """
+        Synthesize text sentence by sentence, yielding audio as it is ready.
+
+        A background thread runs duration prediction, text encoding and the
+        denoising loop for upcoming sentences while the vocoder decodes the
+        current one. Each sentence is trimmed to its predicted duration and
+        faded in and out over fade_duration so the joins do not click.
+
+        Args:
+            text: Input text
+            style: Single-speaker voice style
+            total_step: Number of denoising steps
+            speed: Speech speed multiplier
+            silence_duration: Silence inserted between sentences in seconds
+            fade_duration: Linear fade at each sentence edge in seconds
+
+        Yields:
+            (1, n_samples) waveforms, one per sentence
+        """
+        assert style.ttl.shape[0] == 1, (
+            "Single speaker text to speech only supports single style"
+        )
+        sentences = [
+            text_chunk
+            for sentence in split_sentences(text)
+            for text_chunk in chunk_text(sentence)
+        ]
+        latents: queue.Queue = queue.Queue(maxsize=STREAM_LOOKAHEAD)
+        stop = threading.Event()
+        done = object()
+
+        def produce():
+            try:
+                for sentence in sentences:
+                    if stop.is_set():
+                        return
+                    latents.put(
+                        self._infer_latent([sentence], style, total_step, speed)
+                    )
+            except Exception as e:
+                latents.put(e)
+                return
+            latents.put(done)
+
+        threading.Thread(target=produce, name="tts-stream", daemon=True).start()
+
+        n_fade = int(fade_duration * self.sample_rate)
+        ramp = np.linspace(0.0, 1.0, n_fade, dtype=np.float32)
+        silence = np.zeros((1, int(silence_duration * self.sample_rate)), np.float32)
+        try:
+            first = True
+            while True:
+                item = latents.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                latent, dur_onnx = item
+                wav = self._decode(latent)[:, : int(dur_onnx[0] * self.sample_rate)]
+                n = min(n_fade, wav.shape[1])
+                wav[:, :n] *= ramp[:n]
+                wav[:, wav.shape[1] - n :] *= ramp[:n][::-1]
+                if not first:
+                    wav = np.concatenate([silence, wav], axis=1)
+                first = False
+                yield wav
+        finally:
+            # Unblock the producer if the consumer stopped early
+            stop.set()
+            while not latents.empty():
+                latents.get_nowait()
+
 
 def length_to_mask(lengths: np.ndarray, max_len: Optional[int] = None) -> np.ndarray:
     """
@@ -292,29 +534,194 @@ def get_latent_mask(
     return latent_mask
 
 
+def get_providers(
+    use_gpu: bool, trt_cache_dir: Optional[str] = None, precision: str = "fp32"
+) -> list:
+    """
+    Build the ONNX Runtime execution provider list.
+
+    Prefers TensorRT, then CUDA, and always ends with CPU so ORT can fall
+    back if a GPU provider fails to initialize. GPU providers are only
+    included when the installed onnxruntime build exposes them.
+
+    Args:
+        use_gpu: Whether to try GPU execution providers
+        trt_cache_dir: Directory for cached TensorRT engines
+        precision: "fp16" to let TensorRT build FP16 engines, anything else
+            keeps them FP32
+
+    Returns:
+        Provider names or (name, options) tuples, in priority order
+    """
+    available = ort.get_available_providers()
+    providers: list = []
+    if use_gpu:
+        if "TensorrtExecutionProvider" in available:
+            fp16 = precision == "fp16"
+            trt_options = {"trt_fp16_enable": "true" if fp16 else "false"}
+            if trt_cache_dir:
+                # Persist built engines and kernel timings so restarts reload
+                # them instead of rebuilding. Cached engines do not record the
+                # precision they were built with, so keep one cache per precision
+                trt_cache_dir = os.path.join(trt_cache_dir, "fp16" if fp16 else "fp32")
+                os.makedirs(trt_cache_dir, exist_ok=True)
+                trt_options["trt_engine_cache_enable"] = "true"
+                trt_options["trt_engine_cache_path"] = trt_cache_dir
+                trt_options["trt_timing_cache_enable"] = "true"
+                trt_options["trt_timing_cache_path"] = trt_cache_dir
+            providers.append(("TensorrtExecutionProvider", trt_options))
+        if "CUDAExecutionProvider" in available:
+            providers.append("CUDAExecutionProvider")
+    providers.append("CPUExecutionProvider")
+    return providers
+
+
+def build_session_options() -> ort.SessionOptions:
+    """
+    Build ONNX Runtime session options tuned for TTS inference.
+
+    Enables all graph optimizations and disables the memory pattern planner,
+    which only helps fixed input shapes while text length varies per request.
+    Ops run sequentially, parallelized within each op over the physical cores
+    (approximated as half the logical CPUs).
+
+    Returns:
+        Session options shared by all four models
+    """
+    opts = ort.SessionOptions()
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    opts.enable_mem_pattern = False
+    opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    opts.intra_op_num_threads = (os.cpu_count() or 2) // 2 or 1
+    opts.inter_op_num_threads = 1
+    return opts
+
+
+def get_optimized_onnx_path(onnx_path: str, providers: list) -> str:
+    """
+    Path of the graph-optimized copy of a model for a provider set.
+
+    Optimized graphs contain provider-specific fused nodes and may use ops
+    newer ORT releases added, so the name is tagged with both.
+    """
+    names = {p[0] if isinstance(p, tuple) else p for p in providers}
+    tag = "cuda" if "CUDAExecutionProvider" in names else "cpu"
+    base = onnx_path[: -len(".onnx")]
+    return f"{base}.{tag}-ort{ort.__version__}.opt.onnx"
+
+
 def load_onnx(
-    onnx_path: str, opts: ort.SessionOptions, providers: list[str]
+    onnx_path: str,
+    opts: ort.SessionOptions,
+    providers: list,
+    cache_optimized: bool = False,
 ) -> ort.InferenceSession:
-    return ort.InferenceSession(onnx_path, sess_options=opts, providers=providers)
+    """
+    Create an inference session, optionally reusing a saved optimized graph.
+
+    With cache_optimized, the first load writes the graph-optimized model
+    next to the original; later loads read it, so the fusion passes have
+    nothing left to do at startup. The copy is written at
+    ORT_ENABLE_EXTENDED, which excludes the hardware-specific layout
+    transforms of ORT_ENABLE_ALL, so it stays valid if the model directory
+    is shared with another host; those transforms still run at load time.
+    A copy that fails to load is deleted and rebuilt from the source model.
+    Nothing is written to a read-only model directory, and caching is
+    skipped when TensorRT is used since ORT cannot serialize
+    TensorRT-compiled nodes.
+
+    Args:
+        onnx_path: Path of the ONNX model
+        opts: Session options; restored to their original values afterwards
+        providers: Execution providers in priority order
+        cache_optimized: Save and reuse the optimized graph
+
+    Returns:
+        Loaded inference session
+    """
+    names = {p[0] if isinstance(p, tuple) else p for p in providers}
+    if not cache_optimized or "TensorrtExecutionProvider" in names:
+        return ort.InferenceSession(onnx_path, sess_options=opts, providers=providers)
+
+    optimized_path = get_optimized_onnx_path(onnx_path, providers)
+    if os.path.exists(optimized_path):
+        try:
+            return ort.InferenceSession(
+                optimized_path, sess_options=opts, providers=providers
+            )
+        except Exception as e:
+            logger.warning(
+                f"Discarding unloadable optimized model {optimized_path}: {e}"
+            )
+            try:
+                os.unlink(optimized_path)
+            except OSError:
+                pass
+
+    if not os.access(os.path.dirname(onnx_path) or ".", os.W_OK):
+        return ort.InferenceSession(onnx_path, sess_options=opts, providers=providers)
+
+    # Write to a temporary name and rename, so an interrupted write never
+    # leaves a truncated copy behind. The session copies the options, so
+    # restoring them afterwards is safe.
+    tmp_path = f"{optimized_path}.tmp"
+    level = opts.graph_optimization_level
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    opts.optimized_model_filepath = tmp_path
+    try:
+        session = ort.InferenceSession(
+            onnx_path, sess_options=opts, providers=providers
+        )
+    finally:
+        opts.graph_optimization_level = level
+        opts.optimized_model_filepath = ""
+    try:
+        os.replace(tmp_path, optimized_path)
+    except OSError as e:
+        logger.warning(f"Could not save optimized model {optimized_path}: {e}")
+    return session
+
+
+def get_onnx_path(onnx_dir: str, name: str, precision: str = "fp32") -> str:
+    """
+    Resolve a model path, preferring the `.fp16.onnx` variant when requested.
+
+    Args:
+        onnx_dir: Directory containing the ONNX models
+        name: Model name without extension
+        precision: "fp16" to prefer the FP16 variant, anything else for FP32
+
+    Returns:
+        Path of the model file to load
+    """
+    if precision == "fp16":
+        fp16_path = os.path.join(onnx_dir, f"{name}.fp16.onnx")
+        if os.path.exists(fp16_path):
+            return fp16_path
+    return os.path.join(onnx_dir, f"{name}.onnx")
 
 
 def load_onnx_all(
-    onnx_dir: str, opts: ort.SessionOptions, providers: list[str]
+    onnx_dir: str,
+    opts: ort.SessionOptions,
+    providers: list,
+    precision: str = "fp32",
+    cache_optimized: bool = False,
 ) -> Tuple[
     ort.InferenceSession,
     ort.InferenceSession,
     ort.InferenceSession,
     ort.InferenceSession,
 ]:
-    dp_onnx_path = os.path.join(onnx_dir, "duration_predictor.onnx")
-    text_enc_onnx_path = os.path.join(onnx_dir, "text_encoder.onnx")
-    vector_est_onnx_path = os.path.join(onnx_dir, "vector_estimator.onnx")
-    vocoder_onnx_path = os.path.join(onnx_dir, "vocoder.onnx")
-
-    dp_ort = load_onnx(dp_onnx_path, opts, providers)
-    text_enc_ort = load_onnx(text_enc_onnx_path, opts, providers)
-    vector_est_ort = load_onnx(vector_est_onnx_path, opts, providers)
-    vocoder_ort = load_onnx(vocoder_onnx_path, opts, providers)
+    dp_onnx_path = get_onnx_path(onnx_dir, "duration_predictor", precision)
+    text_enc_onnx_path = get_onnx_path(onnx_dir, "text_encoder", precision)
+    vector_est_onnx_path = get_onnx_path(onnx_dir, "vector_estimator", precision)
+    vocoder_onnx_path = get_onnx_path(onnx_dir, "vocoder", precision)
+
+    dp_ort = load_onnx(dp_onnx_path, opts, providers, cache_optimized)
+    text_enc_ort = load_onnx(text_enc_onnx_path, opts, providers, cache_optimized)
+    vector_est_ort = load_onnx(vector_est_onnx_path, opts, providers, cache_optimized)
+    vocoder_ort = load_onnx(vocoder_onnx_path, opts, providers, cache_optimized)
     return dp_ort, text_enc_ort, vector_est_ort, vocoder_ort
 
 
@@ -331,19 +738,33 @@ def load_text_processor(onnx_dir: str) -> UnicodeProcessor:
     return text_processor
 
 
-def load_text_to_speech(onnx_dir: str, use_gpu: bool = False) -> TextToSpeech:
-    opts = ort.SessionOptions()
-    if use_gpu:
-        raise NotImplementedError("GPU mode is not fully tested")
-    else:
-        providers = ["CPUExecutionProvider"]
+def load_text_to_speech(
+    onnx_dir: str,
+    use_gpu: bool = False,
+    trt_cache_dir: Optional[str] = None,
+    precision: str = "fp32",
+    use_io_binding: bool = False,
+    session_options: Optional[ort.SessionOptions] = None,
+    cache_optimized: bool = False,
+) -> TextToSpeech:
+    opts = session_options or ort.SessionOptions()
+    providers = get_providers(use_gpu, trt_cache_dir, precision)
+    # FP16 only pays off on GPU; ORT's CPU provider would insert casts instead
+    if providers == ["CPUExecutionProvider"]:
+        precision = "fp32"
     cfgs = load_cfgs(onnx_dir)
     dp_ort, text_enc_ort, vector_est_ort, vocoder_ort = load_onnx_all(
-        onnx_dir, opts, providers
+        onnx_dir, opts, providers, precision, cache_optimized
     )
     text_processor = load_text_processor(onnx_dir)
     return TextToSpeech(
-        cfgs, text_processor, dp_ort, text_enc_ort, vector_est_ort, vocoder_ort
+        cfgs,
+        text_processor,
+        dp_ort,
+        text_enc_ort,
+        vector_est_ort,
+        vocoder_ort,
+        use_io_binding=use_io_binding,
     )
 
 
@@ -399,10 +820,8 @@ def chunk_text(text: str, max_len: int = 300) -> list[str]:
         if not paragraph:
             continue
 
-        # Split by sentence boundaries (period, question mark, exclamation mark followed by space)
-        # But exclude common abbreviations
-        pattern = r"(?<!Mr\.)(?<!Mrs\.)(?<!Ms\.)(?<!Dr\.)(?<!Prof\.)(?<!Sr\.)(?<!Jr\.)(?<!Ph\.D\.)(?<!etc\.)(?<!e\.g\.)(?<!i\.e\.)(?<!vs\.)(?<!Inc\.)(?<!Ltd\.)(?<!Co\.)(?<!Corp\.)(?<!St\.)(?<!Ave\.)(?<!Blvd\.)(?<!\b[A-Z]\.)(?<=[.!?])\s+"
-        sentences = re.split(pattern, paragraph)
+        # Split by sentence boundaries
+        sentences = re.split(SENTENCE_BOUNDARY_PATTERN, paragraph)
 
         current_chunk = ""
 
@@ -420,6 +839,27 @@ def chunk_text(text: str, max_len: int = 300) -> list[str]:
     return chunks
 
 
+def split_sentences(text: str) -> list[str]:
+    """
+    Split text into individual sentences.
+
+    Uses the same paragraph and sentence boundaries as chunk_text, without
+    packing sentences together.
+
+    Args:
+        text: Input text to split
+
+    Returns:
+        List of sentences
+    """
+    sentences = []
+    for paragraph in re.split(r"\n\s*\n+", text.strip()):
+        for sentence in re.split(SENTENCE_BOUNDARY_PATTERN, paragraph.strip()):
+            if sentence.strip():
+                sentences.append(sentence.strip())
+    return sentences
+
+
 @contextmanager
 def timer(name: str):
     start = time.time()
@@ -1,17 +1,33 @@
 """
 TTS Service using Supertonic ONNX models.
 Properly implements the multi-model architecture from Supertonic.
+
+Transports that can carry binary data should use `synthesize()` and send the
+WAV bytes directly, e.g. `Response(content=audio, media_type="audio/wav")` as
+the /api/v1/tts/audio endpoint does. `synthesize_base64()` is only for JSON
+responses and encodes with pybase64's SIMD kernels.
 """
 
+import asyncio
+import hashlib
 import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import numpy as np
+import pybase64
 import soundfile as sf
+from cachetools import LRUCache
 import io
-import base64
+import struct
 
+from config import settings
 from services.tts_helper import (
+    BATCH_MAX_ROWS,
+    build_session_options,
+    chunk_text,
     load_text_to_speech,
     load_voice_style,
     TextToSpeech,
@@ -20,16 +36,144 @@ from services.tts_helper import (
 
 logger = logging.getLogger(__name__)
 
+# (rows, text length) batches synthesized at startup. On GPU the smallest and
+# largest shapes let TensorRT build engines covering every input in between:
+# one short text, and a full batch of 300-character texts, the longest chunk
+# chunk_text produces from sentences that fit
+TTS_WARMUP_SHAPES = ((1, 8), (BATCH_MAX_ROWS, 300))
+
+# Total size of encoded clips kept in the synthesis cache (64 MB), and the
+# largest single clip worth caching (2 MB, ~24 s of 16-bit 44.1 kHz audio)
+TTS_SYNTHESIS_CACHE_MAX_BYTES = 64 * 1024 * 1024
+TTS_SYNTHESIS_CACHE_MAX_CLIP_BYTES = 2 * 1024 * 1024
+
+# Per-thread reusable float32 output buffer length; grown for longer audio
+TTS_OUTPUT_BUFFER_SECONDS = 30
+
+# RIFF and data chunk sizes for streamed WAV, whose length is unknown upfront
+WAV_STREAM_SIZE = 0xFFFFFFFF
+
+# Clips up to this size (~64 KB) are base64-encoded on the event loop; the
+# encode takes tens of microseconds, less than a thread handoff
+BASE64_INLINE_MAX_BYTES = 64 * 1024
+
+# Small pool for encoding longer clips off the event loop; pybase64 releases
+# the GIL
+B64_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="b64")
+
+# Micro-batching for synthesize_async: at most this many queued requests run
+# as one padded batch, collected for up to this long after the first arrives
+TTS_BATCH_MAX = 8
+TTS_BATCH_MAX_WAIT_MS = 3
+
+
+def _wav_header(
+    n_samples: int, sample_rate: int, channels: int = 1, bits: int = 16
+) -> bytes:
+    """Build the 44-byte RIFF header of a PCM WAV file."""
+    block_align = channels * bits // 8
+    data_size = n_samples * block_align
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        bits,
+        b"data",
+        data_size,
+    )
+
+
+def _pcm16_bytes(audio: np.ndarray, out: Optional[np.ndarray] = None) -> bytes:
+    """
+    Quantize mono float audio to little-endian 16-bit PCM samples.
+
+    Quantizes exactly like libsndfile's float to PCM_16 conversion, so the
+    output matches what soundfile wrote before. Out-of-range samples saturate
+    in the clip below, so the audio does not need clipping to [-1, 1] first.
+
+    This is four passes over the samples (scale, floor and clip in place on
+    one float32 buffer, then the int16 cast) with no other temporaries; pass
+    out to reuse a scratch buffer instead of allocating one.
+
+    Args:
+        audio: Audio samples, nominally in [-1, 1]
+        out: Optional float32 scratch buffer of the same size as audio
+    """
+    pcm = np.multiply(audio, np.float32(32768.0), out=out, dtype=np.float32)
+    np.floor(pcm, out=pcm)
+    np.clip(pcm, -32768.0, 32767.0, out=pcm)
+    return pcm.astype("<i2").tobytes()
+
+
+def _encode_wav_pcm16(
+    audio: np.ndarray, header_template: bytes, out: Optional[np.ndarray] = None
+) -> bytes:
+    """
+    Encode mono float audio as a 16-bit PCM WAV file.
+
+    Args:
+        audio: Audio samples, nominally in [-1, 1]
+        header_template: Header from `_wav_header(0, sample_rate)`; only its
+            two length fields are patched
+        out: Optional float32 scratch buffer of the same size as audio
+    """
+    data = _pcm16_bytes(audio, out=out)
+    header = bytearray(header_template)
+    struct.pack_into("<I", header, 4, 36 + len(data))
+    struct.pack_into("<I", header, 40, len(data))
+    return b"".join((header, data))
+
+
+def _b64_str(data: bytes) -> str:
+    """Base64-encode data in a single pybase64 call and return it as str."""
+    return pybase64.b64encode(data).decode("ascii")
+
 
 class TTSService:
     """Service for text-to-speech using Supertonic ONNX models."""
 
-    def __init__(self, assets_dir: Optional[str] = None):
+    __slots__ = (
+        "assets_dir",
+        "onnx_dir",
+        "voice_styles_dir",
+        "trt_cache_dir",
+        "tts",
+        "default_style",
+        "_style_files",
+        "_styles",
+        "_sample_rate",
+        "_local",
+        "_wav_header_template",
+        "_synthesis_cache",
+        "_synthesis_cache_lock",
+        "_batch_loop",
+        "_batch_queue",
+        "_batch_lock",
+        "_init_lock",
+        "_initialized",
+        "_ready",
+    )
+
+    def __init__(
+        self,
+        assets_dir: Optional[str] = None,
+        synthesis_cache_max_bytes: int = TTS_SYNTHESIS_CACHE_MAX_BYTES,
+    ):
         """
         Initialize TTS service.
 
         Args:
             assets_dir: Directory containing Supertonic assets (default: ./assets)
+            synthesis_cache_max_bytes: Total size of synthesized clips kept in
+                memory
         """
         if assets_dir is None:
             # Default to assets directory in server root
@@ -38,10 +182,33 @@ class TTSService:
         self.assets_dir = Path(assets_dir)
         self.onnx_dir = self.assets_dir / "onnx"
         self.voice_styles_dir = self.assets_dir / "voice_styles"
+        self.trt_cache_dir = self.onnx_dir / "trt_cache"
 
         self.tts: Optional[TextToSpeech] = None
         self.default_style: Optional[Style] = None
+        # style_id -> loaded Style; populated lazily from the sorted style files
+        self._style_files: List[Path] = []
+        self._styles: Dict[int, Style] = {}
+        self._sample_rate = 0
+        # Per-thread state: the reusable output scratch buffer
+        self._local = threading.local()
+        # PCM16 mono header for the model's sample rate, built in initialize
+        self._wav_header_template = b""
+        # (style_id, speed, steps, format, text digest) -> encoded audio,
+        # bounded by total bytes rather than clip count
+        self._synthesis_cache: LRUCache = LRUCache(
+            maxsize=synthesis_cache_max_bytes, getsizeof=len
+        )
+        self._synthesis_cache_lock = threading.Lock()
+        # Micro-batching worker: an asyncio loop on a dedicated thread
+        self._batch_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_lock = threading.Lock()
+        self._init_lock = threading.Lock()
         self._initialized = False
+        # Set once models and the default style are loaded, so the synthesis
+        # precondition is a single attribute check
+        self._ready = False
 
     def initialize(self) -> bool:
         """
@@ -53,64 +220,141 @@ class TTSService:
         if self._initialized:
             return True
 
-        try:
-            # Check if ONNX directory exists
-            if not self.onnx_dir.exists():
-                logger.error(f"ONNX directory not found: {self.onnx_dir}")
-                return False
+        # Concurrent first requests must not each load the ONNX sessions
+        with self._init_lock:
+            if self._initialized:
+                return True
+
+            try:
+                # List the ONNX directory once instead of stat-ing every file
+                try:
+                    onnx_files = set(os.listdir(self.onnx_dir))
+                except FileNotFoundError:
+                    logger.error(f"ONNX directory not found: {self.onnx_dir}")
+                    return False
 
-            # Check for required ONNX files
-            required_files = [
-                "duration_predictor.onnx",
-                "text_encoder.onnx",
-                "vector_estimator.onnx",
-                "vocoder.onnx",
-                "tts.json",
-                "unicode_indexer.json",
-            ]
-            for file in required_files:
-                if not (self.onnx_dir / file).exists():
-                    logger.error(f"Required file not found: {self.onnx_dir / file}")
+                # Check for required ONNX files
+                required_files = [
+                    "duration_predictor.onnx",
+                    "text_encoder.onnx",
+                    "vector_estimator.onnx",
+                    "vocoder.onnx",
+                    "tts.json",
+                    "unicode_indexer.json",
+                ]
+                missing = [f for f in required_files if f not in onnx_files]
+                if missing:
+                    for file in missing:
+                        logger.error(f"Required file not found: {self.onnx_dir / file}")
                     return False
 
-            # Load TTS model
-            logger.info(f"Loading Supertonic TTS models from {self.onnx_dir}")
-            self.tts = load_text_to_speech(str(self.onnx_dir), use_gpu=False)
-
-            # Load default voice style (style_id 0)
-            # Look for voice style files in the voice_styles directory
-            if self.voice_styles_dir.exists():
-                style_files = sorted(list(self.voice_styles_dir.glob("*.json")))
-                if style_files:
-                    logger.info(f"Loading voice style from {style_files[0]}")
-                    self.default_style = load_voice_style([str(style_files[0])])
-                else:
+                # Load TTS model
+                logger.info(f"Loading Supertonic TTS models from {self.onnx_dir}")
+                # Prefer TensorRT/CUDA when available, falling back to CPU
+                self.tts = load_text_to_speech(
+                    str(self.onnx_dir),
+                    use_gpu=True,
+                    trt_cache_dir=str(self.trt_cache_dir),
+                    precision=settings.tts_precision,
+                    use_io_binding=True,
+                    session_options=build_session_options(),
+                    cache_optimized=True,
+                )
+                logger.info(
+                    f"TTS execution providers: {self.tts.vocoder_ort.get_providers()}"
+                )
+
+                # Discover voice style files; style_id indexes this sorted list
+                # Look for voice style files in the voice_styles directory with a
+                # single directory read
+                try:
+                    with os.scandir(self.voice_styles_dir) as entries:
+                        style_files = sorted(
+                            Path(e.path)
+                            for e in entries
+                            if e.is_file() and e.name.endswith(".json")
+                        )
+                except FileNotFoundError:
+                    style_files = []
+                if not style_files:
                     logger.warning("No voice style files found, using default")
-                    # Create a minimal default style (this may need adjustment based on actual format)
-                    # For now, we'll try to find style files in other locations
-                    style_files = list(self.assets_dir.rglob("*.json"))
-                    style_files = [f for f in style_files if "style" in f.name.lower()]
-                    if style_files:
-                        logger.info(f"Found style file: {style_files[0]}")
-                        self.default_style = load_voice_style([str(style_files[0])])
-                    else:
-                        raise RuntimeError("No voice style files found")
-            else:
-                # Try to find style files elsewhere
-                style_files = list(self.assets_dir.rglob("*style*.json"))
-                if style_files:
-                    logger.info(f"Loading voice style from {style_files[0]}")
-                    self.default_style = load_voice_style([str(style_files[0])])
-                else:
+                    # Only walk the whole assets tree when the primary dir is empty
+                    style_files = sorted(
+                        f
+                        for f in self.assets_dir.rglob("*.json")
+                        if "style" in f.name.lower()
+                    )
+                if not style_files:
                     raise RuntimeError("No voice style files found")
+                logger.info(f"Found {len(style_files)} voice style file(s)")
 
-            self._initialized = True
-            logger.info("Supertonic TTS service initialized successfully")
-            return True
+                # Load default voice style (style_id 0); others load on first use
+                self._style_files = style_files
+                self._styles.clear()
+                self.default_style = self._load_style(0)
+
+                self._sample_rate = self.tts.sample_rate
+                self._wav_header_template = _wav_header(0, self._sample_rate)
+                self._warmup()
+
+                self._ready = self.tts is not None and self.default_style is not None
+                self._initialized = True
+                logger.info("Supertonic TTS service initialized successfully")
+                return True
+
+            except Exception as e:
+                logger.error(f"Failed to initialize TTS service: {e}", exc_info=True)
+                return False
+
+    def _load_style(self, style_id: int) -> Style:
+        """
+        Return the voice style for an ID, loading and caching it on first use.
+
+        Args:
+            style_id: Index into the sorted voice style files
 
+        Returns:
+            Loaded voice style
+
+        Raises:
+            ValueError: If no style file exists for the ID
+        """
+        style = self._styles.get(style_id)
+        if style is not None:
+            return style
+        if not 0 <= style_id < len(self._style_files):
+            raise ValueError(f"Unknown voice style_id {style_id}")
+
+        style_file = self._style_files[style_id]
+        logger.info(f"Loading voice style {style_id} from {style_file}")
+        style = load_voice_style([str(style_file)])
+        self._styles[style_id] = style
+        return style
+
+    def _warmup(self) -> None:
+        """
+        Run warm-up syntheses so GPU kernels and TensorRT engines are built
+        during startup instead of on the first user request.
+
+        On GPU this runs the smallest and largest batch shapes through the
+        same batch() path as live requests, since TensorRT builds engines for
+        the range of input shapes it has seen; on CPU a single short run is
+        enough.
+        """
+        on_gpu = self.tts.vocoder_ort.get_providers()[0] != "CPUExecutionProvider"
+        shapes = TTS_WARMUP_SHAPES if on_gpu else TTS_WARMUP_SHAPES[:1]
+        try:
+            for rows, length in shapes:
+                text = ("hello " * length)[:length]
+                self.tts.batch(
+                    [text] * rows,
+                    [self.default_style] * rows,
+                    total_step=1,
+                    speeds=[1.0] * rows,
+                )
+            logger.info(f"TTS warm-up completed for (rows, length) {shapes}")
         except Exception as e:
-            logger.error(f"Failed to initialize TTS service: {e}", exc_info=True)
-            return False
+            logger.warning(f"TTS warm-up inference failed: {e}")
 
     def synthesize(
         self,
@@ -118,6 +362,7 @@ class TTSService:
         inference_steps: int = 2,
         style_id: int = 0,
         speed: float = 1.05,
+        audio_format: str = "wav",
     ) -> bytes:
         """
         Synthesize speech from text.
@@ -127,51 +372,335 @@ class TTSService:
             inference_steps: Number of inference steps (default: 2)
             style_id: Voice style ID (default: 0)
             speed: Speech speed multiplier (default: 1.05)
+            audio_format: "wav" for 16-bit PCM or "wav_float" for 32-bit float
 
         Returns:
             Audio data as WAV bytes
 
         Raises:
+            ValueError: If the text is empty or the style_id is unknown; the
+                style is resolved before any model runs
             RuntimeError: If service is not initialized or synthesis fails
         """
-        if not self._initialized:
-            if not self.initialize():
-                raise RuntimeError("TTS service not initialized")
+        if not self._ready and not self.initialize():
+            raise RuntimeError("TTS service not initialized")
 
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
-        if self.tts is None or self.default_style is None:
-            raise RuntimeError("TTS models not loaded")
+        style = self._load_style(style_id)
+
+        cache_key = self._cache_key(
+            text, inference_steps, style_id, speed, audio_format
+        )
+        with self._synthesis_cache_lock:
+            cached = self._synthesis_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
             # Generate audio using the TextToSpeech pipeline
-            wav, _ = self.tts(
-                text, self.default_style, total_step=inference_steps, speed=speed
-            )
+            wav, _ = self.tts(text, style, total_step=inference_steps, speed=speed)
+        except ValueError as e:
+            # Input the models cannot handle; expected, so no traceback
+            logger.warning(f"TTS synthesis rejected input: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"TTS synthesis failed: {e}", exc_info=True)
+            raise RuntimeError(f"TTS synthesis failed: {str(e)}")
 
-            # Extract audio array (remove batch dimension if present)
-            if len(wav.shape) > 1:
-                audio_array = wav[0] if wav.shape[0] == 1 else wav.squeeze()
-            else:
-                audio_array = wav
+        # Drop the batch dimension (a view for single-speaker output) and
+        # encode through this thread's reusable scratch buffer
+        flat = wav.reshape(-1)
+        audio_bytes = self._encode_audio(
+            flat, audio_format, out=self._get_out_buf(flat.size)
+        )
 
-            # Ensure audio is float32 and in valid range
-            audio_array = audio_array.astype(np.float32)
-            audio_array = np.clip(audio_array, -1.0, 1.0)
+        self._cache_audio(cache_key, audio_bytes)
+        return audio_bytes
 
-            # Get sample rate from TTS config
-            sample_rate = self.tts.sample_rate
+    def _get_out_buf(self, size: int) -> np.ndarray:
+        """
+        Return this thread's float32 scratch buffer, sized to size.
 
-            # Convert to WAV bytes
+        synthesize runs on the event loop, executor threads and the batching
+        worker, so each thread gets its own buffer; the encoded bytes are
+        copied out before the call returns, so reuse within a thread is safe.
+        """
+        buf = getattr(self._local, "out_buf", None)
+        if buf is None or buf.size < size:
+            length = max(size, TTS_OUTPUT_BUFFER_SECONDS * self._sample_rate)
+            buf = np.empty(length, dtype=np.float32)
+            self._local.out_buf = buf
+        return buf[:size]
+
+    @staticmethod
+    def _cache_key(
+        text: str, inference_steps: int, style_id: int, speed: float, audio_format: str
+    ) -> tuple:
+        """Build the synthesis cache key for a request."""
+        return (
+            style_id,
+            round(speed, 3),
+            inference_steps,
+            audio_format,
+            hashlib.blake2b(text.encode(), digest_size=16).digest(),
+        )
+
+    def _cache_audio(self, cache_key: tuple, audio_bytes: bytes) -> None:
+        """Store a synthesized clip, skipping clips too large to be worth caching."""
+        if len(audio_bytes) > TTS_SYNTHESIS_CACHE_MAX_CLIP_BYTES:
+            return
+        with self._synthesis_cache_lock:
+            self._synthesis_cache[cache_key] = audio_bytes
+
+    def _encode_audio(
+        self,
+        samples: np.ndarray,
+        audio_format: str,
+        out: Optional[np.ndarray] = None,
+    ) -> bytes:
+        """
+        Encode mono float model output as WAV bytes, clipping to [-1, 1].
+
+        Args:
+            samples: Flat audio samples from the vocoder
+            audio_format: "wav" for 16-bit PCM or "wav_float" for 32-bit float
+            out: Optional float32 scratch buffer of the same size as samples
+
+        Returns:
+            WAV file bytes
+        """
+        if audio_format == "wav_float":
+            audio_array = np.clip(samples, -1.0, 1.0, out=out, casting="same_kind")
             buffer = io.BytesIO()
-            sf.write(buffer, audio_array, sample_rate, format="WAV")
-            buffer.seek(0)
-            return buffer.read()
+            sf.write(
+                buffer,
+                audio_array,
+                self._sample_rate,
+                format="WAV",
+                subtype="FLOAT",
+            )
+            return buffer.getvalue()
+        # Encode 16-bit PCM directly, saturating during quantization instead
+        # of clipping in a separate pass; no libsndfile
+        return _encode_wav_pcm16(samples, self._wav_header_template, out=out)
+
+    async def synthesize_async(
+        self,
+        text: str,
+        inference_steps: int = 2,
+        style_id: int = 0,
+        speed: float = 1.05,
+        audio_format: str = "wav",
+    ) -> bytes:
+        """
+        Synthesize speech without blocking the event loop.
+
+        Requests are queued to a background worker that runs concurrent
+        requests through the models as one padded batch, so they share a
+        single pass instead of serializing on the ONNX sessions.
+
+        Args:
+            text: Input text to convert to speech
+            inference_steps: Number of inference steps (default: 2)
+            style_id: Voice style ID (default: 0)
+            speed: Speech speed multiplier (default: 1.05)
+            audio_format: "wav" for 16-bit PCM or "wav_float" for 32-bit float
+
+        Returns:
+            Audio data as WAV bytes
+
+        Raises:
+            ValueError: If the text is empty or the style_id is unknown
+            RuntimeError: If service is not initialized or synthesis fails
+        """
+        if not self._ready and not self.initialize():
+            raise RuntimeError("TTS service not initialized")
 
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        style = self._load_style(style_id)
+
+        cache_key = self._cache_key(
+            text, inference_steps, style_id, speed, audio_format
+        )
+        with self._synthesis_cache_lock:
+            cached = self._synthesis_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        future: Future = Future()
+        item = (text, style, inference_steps, speed, audio_format, cache_key, future)
+        loop, queue = self._ensure_batch_worker()
+        loop.call_soon_threadsafe(queue.put_nowait, item)
+        return await asyncio.wrap_future(future)
+
+    def _ensure_batch_worker(self) -> Tuple[asyncio.AbstractEventLoop, asyncio.Queue]:
+        """Start the micro-batching worker thread on first use."""
+        with self._batch_lock:
+            if self._batch_loop is None:
+                loop = asyncio.new_event_loop()
+                queue: asyncio.Queue = asyncio.Queue()
+                loop.create_task(self._batch_worker(queue))
+                threading.Thread(
+                    target=loop.run_forever, name="tts-batch", daemon=True
+                ).start()
+                self._batch_loop = loop
+                self._batch_queue = queue
+            return self._batch_loop, self._batch_queue
+
+    async def _batch_worker(self, queue: asyncio.Queue) -> None:
+        """Collect queued requests into micro-batches and synthesize them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + TTS_BATCH_MAX_WAIT_MS / 1000
+            while len(batch) < TTS_BATCH_MAX:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Inference runs on this dedicated thread; ONNX Runtime releases
+            # the GIL, so the main event loop keeps serving other requests.
+            # The denoising loop runs a single step count, so group by it.
+            # Requests whose caller was cancelled meanwhile are dropped;
+            # the rest can no longer be cancelled once marked running.
+            groups: Dict[int, list] = {}
+            for item in batch:
+                if item[6].set_running_or_notify_cancel():
+                    groups.setdefault(item[2], []).append(item)
+            for inference_steps, items in groups.items():
+                try:
+                    self._run_batch(inference_steps, items)
+                except Exception as e:
+                    # Never let one batch stop the worker for every later request
+                    logger.error(f"TTS batch worker error: {e}", exc_info=True)
+                    for item in items:
+                        if not item[6].done():
+                            item[6].set_exception(
+                                RuntimeError(f"TTS synthesis failed: {str(e)}")
+                            )
+
+    def _run_batch(self, inference_steps: int, items: list) -> None:
+        """
+        Synthesize one micro-batch and resolve each request's future.
+
+        Requests that fit in a single chunk run together and are resolved
+        first; longer requests then run one at a time, shortest first, so a
+        short request never waits for a long one queued next to it.
+
+        Args:
+            inference_steps: Denoising steps shared by the batch
+            items: Queued (text, style, steps, speed, format, cache key,
+                future) tuples
+        """
+        short = []
+        long = []
+        for item in items:
+            n_chunks = len(chunk_text(item[0]))
+            if n_chunks <= 1:
+                short.append(item)
+            else:
+                long.append((n_chunks, item))
+        if short:
+            self._run_padded_batch(inference_steps, short)
+        for _, item in sorted(long, key=lambda entry: entry[0]):
+            self._run_padded_batch(inference_steps, [item])
+
+    def _run_padded_batch(self, inference_steps: int, items: list) -> None:
+        """
+        Synthesize requests in one padded batch and resolve their futures.
+
+        Args:
+            inference_steps: Denoising steps shared by the batch
+            items: Queued (text, style, steps, speed, format, cache key,
+                future) tuples
+        """
+        try:
+            wavs = self.tts.batch(
+                [item[0] for item in items],
+                [item[1] for item in items],
+                total_step=inference_steps,
+                speeds=[item[3] for item in items],
+            )
         except Exception as e:
-            logger.error(f"TTS synthesis failed: {e}", exc_info=True)
-            raise RuntimeError(f"TTS synthesis failed: {str(e)}")
+            logger.error(f"TTS batch synthesis failed: {e}", exc_info=True)
+            for item in items:
+                item[6].set_exception(RuntimeError(f"TTS synthesis failed: {str(e)}"))
+            return
+
+        logger.debug(f"Synthesized TTS batch of {len(items)} request(s)")
+        for item, wav in zip(items, wavs):
+            _, _, _, _, audio_format, cache_key, future = item
+            try:
+                flat = wav.reshape(-1)
+                audio_bytes = self._encode_audio(
+                    flat, audio_format, out=self._get_out_buf(flat.size)
+                )
+            except Exception as e:
+                logger.error(f"TTS encoding failed: {e}", exc_info=True)
+                future.set_exception(RuntimeError(f"TTS synthesis failed: {str(e)}"))
+                continue
+            self._cache_audio(cache_key, audio_bytes)
+            future.set_result(audio_bytes)
+
+    def synthesize_stream(
+        self,
+        text: str,
+        inference_steps: int = 2,
+        style_id: int = 0,
+        speed: float = 1.05,
+    ) -> Iterator[bytes]:
+        """
+        Synthesize speech sentence by sentence as a streamed 16-bit PCM WAV.
+
+        The first chunk is a WAV header with unknown-length sizes; each
+        following chunk holds one sentence's PCM samples, produced while the
+        next sentence is still being synthesized. Streamed audio bypasses the
+        synthesis cache.
+
+        Args:
+            text: Input text to convert to speech
+            inference_steps: Number of inference steps (default: 2)
+            style_id: Voice style ID (default: 0)
+            speed: Speech speed multiplier (default: 1.05)
+
+        Returns:
+            Iterator over WAV byte chunks
+
+        Raises:
+            ValueError: If the text is empty or the style_id is unknown
+            RuntimeError: If service is not initialized
+        """
+        if not self._ready and not self.initialize():
+            raise RuntimeError("TTS service not initialized")
+
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        # Resolve the style now so invalid requests fail before streaming
+        style = self._load_style(style_id)
+        return self._stream_chunks(text, style, inference_steps, speed)
+
+    def _stream_chunks(
+        self, text: str, style: Style, inference_steps: int, speed: float
+    ) -> Iterator[bytes]:
+        """Yield the streamed WAV header followed by per-sentence PCM data."""
+        header = bytearray(self._wav_header_template)
+        struct.pack_into("<I", header, 4, WAV_STREAM_SIZE)
+        struct.pack_into("<I", header, 40, WAV_STREAM_SIZE)
+        yield bytes(header)
+
+        for wav in self.tts.stream(
+            text, style, total_step=inference_steps, speed=speed
+        ):
+            yield _pcm16_bytes(wav.reshape(-1))
 
     def synthesize_base64(
         self,
@@ -191,9 +720,43 @@ class TTSService:
 
         Returns:
             Base64-encoded WAV audio data
+
+        Raises:
+            ValueError: If the text is empty or the style_id is unknown
+            RuntimeError: If service is not initialized or synthesis fails
         """
         audio_bytes = self.synthesize(text, inference_steps, style_id, speed)
-        return base64.b64encode(audio_bytes).decode("utf-8")
+        return _b64_str(audio_bytes)
+
+    async def synthesize_base64_async(
+        self,
+        text: str,
+        inference_steps: int = 2,
+        style_id: int = 0,
+        speed: float = 1.05,
+    ) -> str:
+        """
+        Batched, non-blocking variant of `synthesize_base64()`.
+
+        Args:
+            text: Input text to convert to speech
+            inference_steps: Number of inference steps (default: 2)
+            style_id: Voice style ID (default: 0)
+            speed: Speech speed multiplier (default: 1.05)
+
+        Returns:
+            Base64-encoded WAV audio data
+        """
+        audio_bytes = await self.synthesize_async(
+            text, inference_steps, style_id, speed
+        )
+        if len(audio_bytes) <= BASE64_INLINE_MAX_BYTES:
+            return _b64_str(audio_bytes)
+        # Longer clips are encoded in one call off the event loop; splitting
+        # them across the pool costs more in handoffs than it saves
+        return await asyncio.get_running_loop().run_in_executor(
+            B64_EXECUTOR, _b64_str, audio_bytes
+        )
 
     def is_initialized(self) -> bool:
         """Check if TTS service is initialized."""